@@ -0,0 +1,59 @@
+"""
+Shared Azure Search indexer clients
+Caches the credential and indexer clients per process so repeated runner and
+data source manager instances reuse one token cache and connection pool
+"""
+
+import functools
+from typing import Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from azure.core.credentials import AzureKeyCredential
+from azure.core.pipeline.transport import RequestsTransport
+from azure.identity import DefaultAzureCredential
+from azure.search.documents.indexes import SearchIndexerClient
+
+
+# Keep-alive connections each cached client keeps to its endpoint
+_POOL_SIZE = 16
+
+# Credential providers unavailable to scripts, skipped by the sync and async credentials
+_CREDENTIAL_EXCLUDES = {
+    'exclude_interactive_browser_credential': True,
+    'exclude_visual_studio_code_credential': True
+}
+
+
+def _pooled_transport() -> RequestsTransport:
+    """Return a requests transport over a session with a sized connection pool"""
+    session = requests.Session()
+    # Retries are left to the azure-core retry policy, as in the SDK's own adapter
+    adapter = HTTPAdapter(
+        pool_connections=_POOL_SIZE,
+        pool_maxsize=_POOL_SIZE,
+        max_retries=Retry(total=False, redirect=False, raise_on_status=False)
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return RequestsTransport(session=session, session_owner=True)
+
+
+@functools.lru_cache(maxsize=1)
+def get_default_credential() -> DefaultAzureCredential:
+    """Return the process-wide DefaultAzureCredential, skipping providers unavailable to scripts"""
+    return DefaultAzureCredential(**_CREDENTIAL_EXCLUDES)
+
+
+def create_async_default_credential():
+    """Return a new async DefaultAzureCredential skipping the same providers; the caller closes it"""
+    from azure.identity.aio import DefaultAzureCredential as AsyncDefaultAzureCredential
+    
+    return AsyncDefaultAzureCredential(**_CREDENTIAL_EXCLUDES)
+
+
+@functools.lru_cache(maxsize=4)
+def get_indexer_client(endpoint: str, key: Optional[str] = None) -> SearchIndexerClient:
+    """Return a cached indexer client for the endpoint, using the key if given or Entra auth"""
+    credential = AzureKeyCredential(key) if key else get_default_credential()
+    return SearchIndexerClient(endpoint=endpoint, credential=credential, transport=_pooled_transport())
\ No newline at end of file
@@ -0,0 +1,6 @@
+"""
+ASGI entry point for the Azure Search Query API
+Used by gunicorn: gunicorn -c gunicorn_conf.py asgi:app
+"""
+
+from azure_search_query_1 import app
\ No newline at end of file
@@ -1,24 +1,185 @@
 """
 Azure Cognitive Search - Query API Script
-This script provides search query functionality with Flask API endpoints
+This script provides search query functionality with async Quart API endpoints
 Supports querying across state-specific indexes with filtering and ranking
 """
 
 import os
 import json
-from flask import Flask, jsonify, request
+import time
+import random
+import heapq
+import asyncio
+import hashlib
+import operator
+import functools
+import re
+import queue
+import logging.handlers
+from contextlib import asynccontextmanager
+from collections import Counter, OrderedDict
+from typing import TYPE_CHECKING
+import orjson
+from quart import Quart, jsonify, request
 from azure.core.credentials import AzureKeyCredential
-from azure.identity import DefaultAzureCredential, ManagedIdentityCredential
-from azure.search.documents import SearchClient
-from azure.search.documents.models import QueryType
+from azure.core.exceptions import HttpResponseError
 import logging
 
+# azure.identity, azure.search.documents and aiohttp are imported where they
+# are first used, so the CLI usage path and tests don't pay for loading them
+if TYPE_CHECKING:
+    import aiohttp
+    from azure.search.documents.aio import SearchClient
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# Initialize Flask app
-app = Flask(__name__)
+# Initialize Quart app
+app = Quart(__name__)
+
+# Fields returned for every hit and the default highlight fields; built once
+# so search() doesn't rebuild them per call
+_DEFAULT_SELECT = ('content', 'metadata_storage_path', 'page_number',
+                   'parent_document', 'document_type', 'metadata_title',
+                   'metadata_creation_date')
+_DEFAULT_HIGHLIGHT_FIELDS = ('content', 'metadata_title')
+_DEFAULT_HIGHLIGHT_CSV = ','.join(_DEFAULT_HIGHLIGHT_FIELDS)
+
+# Accepted query_type values; anything else falls back to simple. These are
+# the QueryType enum values, which the SDK accepts as plain strings
+_QUERY_TYPES = frozenset({'simple', 'full', 'semantic'})
+
+# Throttling and transient server errors from Azure Search that are worth
+# retrying (the codes the SDK's own retry policy covers, which search clients
+# leave to _run_query), and the most attempts made for a single query
+_RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+_MAX_SEARCH_ATTEMPTS = 4
+
+# Range keys accepted in filter dicts and the OData operator each maps to
+_RANGE_OPERATORS = (('gte', 'ge'), ('lte', 'le'), ('gt', 'gt'), ('lt', 'lt'))
+
+# String range bounds matching these are emitted as bare OData number or
+# DateTimeOffset literals; any other string bound is quoted
+_ODATA_BARE_LITERAL = re.compile(
+    r'-?\d+(\.\d+)?([eE][+-]?\d+)?'
+    r'|\d{4}-\d{2}-\d{2}T\d{2}:\d{2}(:\d{2}(\.\d+)?)?(Z|[+-]\d{2}:\d{2})'
+)
+
+
+def _odata_escape(value: str) -> str:
+    """Escape a string for use inside a single-quoted OData literal"""
+    return value.replace("'", "''")
+
+
+def _odata_literal(typed_value: tuple, quote_strings: bool = True) -> str:
+    """
+    Render a (type name, value) pair from _canonical_filters as an OData literal
+    
+    Booleans, numbers and null are emitted bare. Strings are quoted and
+    escaped, except number or date strings when quote_strings is False.
+    """
+    type_name, value = typed_value
+    if type_name == 'bool':
+        return 'true' if value else 'false'
+    if type_name in ('int', 'float'):
+        return repr(value)
+    if type_name == 'NoneType':
+        return 'null'
+    value = str(value)
+    if not quote_strings and _ODATA_BARE_LITERAL.fullmatch(value):
+        return value
+    return f"'{_odata_escape(value)}'"
+
+
+def _typed(value) -> tuple:
+    """Pair a filter value with its type name, making lists hashable"""
+    if isinstance(value, list):
+        value = tuple(value)
+    return (type(value).__name__, value)
+
+
+def _canonical_filters(filters: dict) -> tuple:
+    """
+    Convert a filters dict into a hashable tuple with a stable field order
+    
+    Each entry is (field, is_range, value); range bounds become a sorted
+    tuple of (key, value) pairs. Values are tagged with their type name so
+    True and 1, which hash alike, still render as different literals
+    """
+    canonical = []
+    for field, value in sorted(filters.items()):
+        if isinstance(value, dict):
+            bounds = tuple(sorted((key, _typed(bound)) for key, bound in value.items()))
+            canonical.append((field, True, bounds))
+        else:
+            canonical.append((field, False, _typed(value)))
+    return tuple(canonical)
+
+
+@functools.lru_cache(maxsize=256)
+def _build_odata_filter(canonical_filters: tuple) -> str:
+    """Build an OData filter expression from canonicalized filters"""
+    filter_parts = []
+    
+    for field, is_range, value in canonical_filters:
+        if is_range:
+            # Handle range queries
+            bounds = dict(value)
+            for key, op in _RANGE_OPERATORS:
+                if key in bounds:
+                    filter_parts.append(f"{field} {op} {_odata_literal(bounds[key], quote_strings=False)}")
+        else:
+            # Handle equality
+            filter_parts.append(f"{field} eq {_odata_literal(value)}")
+    
+    return ' and '.join(filter_parts)
+
+
+@functools.lru_cache(maxsize=32)
+def _highlight_csv(highlight_fields: tuple) -> str:
+    """Join highlight fields into the comma-separated form the service expects"""
+    return ','.join(highlight_fields)
+
+
+def _validate_highlight_fields(highlight_fields) -> tuple:
+    """Return highlight_fields as a tuple, raising ValueError unless it is a list of field names"""
+    if not isinstance(highlight_fields, (list, tuple)) or not highlight_fields:
+        raise ValueError("'highlight_fields' must be a non-empty list of field names")
+    for field in highlight_fields:
+        if not isinstance(field, str) or not field or ',' in field:
+            raise ValueError(f"Invalid highlight field: {field!r}")
+    return tuple(highlight_fields)
+
+
+class _ResultCache:
+    """Small LRU cache whose entries expire a fixed number of seconds after insertion"""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+    
+    def get(self, key: str):
+        """Return the cached value for key, or None if missing or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+    
+    def set(self, key: str, value):
+        """Store value under key, evicting the least recently used entries"""
+        if self.maxsize <= 0 or self.ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
 
 
 class AzureSearchQuery:
@@ -44,10 +205,38 @@ class AzureSearchQuery:
         
         # State configurations from JSON
         self.states = self.config.get('states', {})
+        self._valid_states = frozenset(self.states)
+        
+        # Optional single index holding every state's documents; when set,
+        # multi-state searches run as one query filtered on the state field,
+        # which must be retrievable and facetable in that index
+        self.unified_index = self.config.get('unified_index')
+        self.unified_state_field = self.config.get('unified_state_field', 'state')
         
         # Initialize credential
         self.credential = self._get_credential()
         
+        # Search clients are created once per index and reused so each index
+        # keeps its HTTP pipeline and pooled connections across queries
+        self._clients: dict[str, 'SearchClient'] = {}
+        
+        # One aiohttp session (created on first use, inside the event loop) is
+        # shared by every index client so they draw from a single keep-alive pool
+        self._pool_size = int(os.getenv('AZURE_SEARCH_POOL_SIZE', self.config.get('pool_size', 32)))
+        self._http_session = None
+        
+        # Cap on concurrent queries so multi-state fan-out doesn't amplify throttling
+        self._inflight = asyncio.BoundedSemaphore(
+            int(os.getenv('AZURE_SEARCH_MAX_INFLIGHT', self.config.get('max_inflight', 16)))
+        )
+        
+        # Short-lived cache of search responses so identical queries don't
+        # round-trip to Azure Search; responses in it are shared, treat as read-only
+        self._result_cache = _ResultCache(
+            maxsize=int(os.getenv('AZURE_SEARCH_CACHE_SIZE', self.config.get('cache_size', 512))),
+            ttl=float(os.getenv('AZURE_SEARCH_CACHE_TTL', self.config.get('cache_ttl', 60)))
+        )
+        
         logger.info("Azure Search Query client initialized successfully")
     
     def _load_config(self, config_path):
@@ -70,6 +259,8 @@ class AzureSearchQuery:
             logger.info("Using API Key authentication")
             return AzureKeyCredential(self.search_key)
         else:
+            from azure.identity.aio import DefaultAzureCredential, ManagedIdentityCredential
+            
             if self.use_user_assigned_identity:
                 logger.info(f"Using User-Assigned Managed Identity: {self.user_assigned_client_id}")
                 return ManagedIdentityCredential(client_id=self.user_assigned_client_id)
@@ -77,23 +268,69 @@ class AzureSearchQuery:
                 logger.info("Using DefaultAzureCredential")
                 return DefaultAzureCredential()
     
-    def _get_search_client(self, state_code: str) -> SearchClient:
+    def _get_search_client(self, state_code: str) -> 'SearchClient':
         """Get search client for a specific state index"""
-        if state_code not in self.states:
+        if state_code not in self._valid_states:
             raise ValueError(f"Invalid state code: {state_code}. Valid codes: {', '.join(self.states.keys())}")
         
-        index_name = self.states[state_code]['index']
-        return SearchClient(
-            endpoint=self.search_endpoint,
-            index_name=index_name,
-            credential=self.credential
-        )
+        return self._get_index_client(self.states[state_code]['index'])
+    
+    def _get_index_client(self, index_name: str) -> 'SearchClient':
+        """Get the cached search client for an index, creating it on first use"""
+        client = self._clients.get(index_name)
+        if client is None:
+            from azure.core.pipeline.transport import AioHttpTransport
+            from azure.search.documents.aio import SearchClient
+            
+            client = SearchClient(
+                endpoint=self.search_endpoint,
+                index_name=index_name,
+                credential=self.credential,
+                transport=AioHttpTransport(session=self._get_http_session(), session_owner=False),
+                # Error responses are retried by _run_query only, so a throttled
+                # query isn't retried by both; connection errors still are by the SDK
+                retry_status=0
+            )
+            self._clients[index_name] = client
+        return client
+    
+    def _get_http_session(self) -> 'aiohttp.ClientSession':
+        """Get the shared aiohttp session with a tuned connection pool, creating it on first use"""
+        if self._http_session is None:
+            import aiohttp
+            
+            connector = aiohttp.TCPConnector(
+                limit=self._pool_size,
+                limit_per_host=self._pool_size,
+                keepalive_timeout=75,
+                ttl_dns_cache=300
+            )
+            # Same session options AioHttpTransport uses for its own sessions;
+            # azure-core handles decompression itself
+            self._http_session = aiohttp.ClientSession(
+                connector=connector,
+                trust_env=True,
+                cookie_jar=aiohttp.DummyCookieJar(),
+                auto_decompress=False
+            )
+        return self._http_session
+    
+    async def close(self):
+        """Close cached search clients, their shared HTTP session and the credential"""
+        for client in self._clients.values():
+            await client.close()
+        self._clients.clear()
+        if self._http_session is not None:
+            await self._http_session.close()
+            self._http_session = None
+        if hasattr(self.credential, 'close'):
+            await self.credential.close()
     
-    def search(self, query: str, state_code: str, top: int = None, 
-               filters: dict = None, search_mode: str = 'any',
-               query_type: str = 'simple', include_total_count: bool = True,
-               highlight_fields: list = None, highlight_pre_tag: str = '<em>',
-               highlight_post_tag: str = '</em>'):
+    async def search(self, query: str, state_code: str, top: int = None, 
+                     filters: dict = None, search_mode: str = 'any',
+                     query_type: str = 'simple', include_total_count: bool = False,
+                     highlight_fields: list = None, highlight_pre_tag: str = '<em>',
+                     highlight_post_tag: str = '</em>', use_cache: bool = True):
         """
         Execute a search query against a specific state index
         
@@ -104,10 +341,11 @@ class AzureSearchQuery:
             filters: Dictionary of filters to apply
             search_mode: 'any' or 'all' - how to combine search terms
             query_type: 'simple', 'full', or 'semantic'
-            include_total_count: Include total count of matching documents
+            include_total_count: Ask the service to count all matching documents (extra work, off by default)
             highlight_fields: List of fields to highlight (default: ['content', 'metadata_title'])
             highlight_pre_tag: HTML tag before highlighted text (default: '<em>')
             highlight_post_tag: HTML tag after highlighted text (default: '</em>')
+            use_cache: Serve identical recent queries from the result cache
         
         Returns:
             Dictionary with search results including highlights
@@ -115,92 +353,155 @@ class AzureSearchQuery:
         try:
             search_client = self._get_search_client(state_code)
             
-            # Build filter string from filters dict
-            filter_str = self._build_filter_string(filters) if filters else None
+            # Reject malformed highlight fields before doing any other work
+            if highlight_fields is not None:
+                highlight_fields = _validate_highlight_fields(highlight_fields)
             
             # Set top_k
             top_k = top if top else self.top_k
             
-            # Map query type
-            query_type_enum = self._get_query_type(query_type)
+            cache_key = self._result_cache_key(
+                query=query, state=state_code, top=top_k, filters=filters,
+                search_mode=search_mode, query_type=query_type,
+                include_total_count=include_total_count,
+                highlight_fields=highlight_fields,
+                highlight_pre_tag=highlight_pre_tag,
+                highlight_post_tag=highlight_post_tag
+            )
+            if use_cache:
+                cached = self._result_cache.get(cache_key)
+                if cached is not None:
+                    logger.info("Cache HIT for search on %s: %r", state_code.upper(), query)
+                    return cached
+            
+            # Build filter string from filters dict
+            filter_str = self._build_filter_string(filters) if filters else None
+            
+            # Validate query type
+            query_type_value = query_type.lower()
+            if query_type_value not in _QUERY_TYPES:
+                query_type_value = 'simple'
             
-            # Default highlight fields
-            if highlight_fields is None:
-                highlight_fields = ['content', 'metadata_title']
+            # Default highlight fields; custom lists repeat often, so their joins are cached
+            highlight_csv = _DEFAULT_HIGHLIGHT_CSV if highlight_fields is None else _highlight_csv(highlight_fields)
             
-            logger.info(f"Executing search query on {state_code.upper()}: '{query}'")
+            logger.info("Executing search query on %s: %r", state_code.upper(), query)
             if filter_str:
-                logger.info(f"With filters: {filter_str}")
+                logger.info("With filters: %s", filter_str)
             
             # Execute search with highlighting
-            results = search_client.search(
+            search_results, results = await self._run_query(
+                search_client,
                 search_text=query,
                 filter=filter_str,
                 top=top_k,
                 search_mode=search_mode,
-                query_type=query_type_enum,
+                query_type=query_type_value,
                 include_total_count=include_total_count,
-                select=['content', 'metadata_storage_path', 'page_number', 
-                       'parent_document', 'document_type', 'metadata_title',
-                       'metadata_creation_date'],
-                highlight_fields=','.join(highlight_fields),
+                select=_DEFAULT_SELECT,
+                highlight_fields=highlight_csv,
                 highlight_pre_tag=highlight_pre_tag,
                 highlight_post_tag=highlight_post_tag
             )
             
-            # Process results
-            search_results = []
-            for result in results:
-                result_data = {
-                    'content': result.get('content', ''),
-                    'score': result.get('@search.score', 0),
-                    'page_number': result.get('page_number', ''),
-                    'parent_document': result.get('parent_document', ''),
-                    'document_type': result.get('document_type', ''),
-                    'metadata_title': result.get('metadata_title', ''),
-                    'metadata_creation_date': str(result.get('metadata_creation_date', '')),
-                    'storage_path': result.get('metadata_storage_path', '')
-                }
-                
-                # Add highlights if available
-                highlights = result.get('@search.highlights', {})
-                if highlights:
-                    result_data['highlights'] = highlights
-                    
-                    # Add convenient highlighted_content field
-                    if 'content' in highlights:
-                        result_data['highlighted_content'] = ' ... '.join(highlights['content'])
-                    
-                    # Add convenient highlighted_title field
-                    if 'metadata_title' in highlights:
-                        result_data['highlighted_title'] = highlights['metadata_title'][0] if highlights['metadata_title'] else None
-                
-                search_results.append(result_data)
+            # Read the count once from the fetched page; it is stored on the
+            # response (and cached with it) rather than re-evaluated
+            total_count = None
+            if include_total_count:
+                try:
+                    total_count = await results.get_count()
+                except Exception as e:
+                    logger.warning("Could not read total count: %s", e)
             
             response = {
                 'query': query,
                 'state': state_code,
                 'state_name': self.states[state_code]['name'],
-                'total_count': results.get_count() if include_total_count else None,
+                'total_count': total_count,
                 'results_count': len(search_results),
                 'results': search_results
             }
             
-            logger.info(f"Search completed. Found {len(search_results)} results")
+            self._result_cache.set(cache_key, response)
+            
+            logger.info("Search completed. Found %d results", len(search_results))
             return response
             
         except Exception as e:
             logger.error(f"Search failed: {str(e)}")
             raise
     
-    def _get_query_type(self, query_type_str: str):
-        """Convert query type string to QueryType enum"""
-        query_type_map = {
-            'simple': QueryType.SIMPLE,
-            'full': QueryType.FULL,
-            'semantic': QueryType.SEMANTIC
-        }
-        return query_type_map.get(query_type_str.lower(), QueryType.SIMPLE)
+    async def _run_query(self, search_client: 'SearchClient', state_field: str = None, **search_kwargs):
+        """
+        Run a query and drain its hits, retrying throttling and transient server errors
+        
+        The request is only sent once the results are iterated, so the retry
+        covers both steps. Returns (hits, results); results still answers
+        get_count() and get_facets() from the fetched page.
+        """
+        for attempt in range(_MAX_SEARCH_ATTEMPTS):
+            try:
+                async with self._inflight:
+                    results = await search_client.search(**search_kwargs)
+                    hits = await self._collect_results(results, state_field)
+                return hits, results
+            except HttpResponseError as e:
+                if e.status_code not in _RETRYABLE_STATUS_CODES or attempt == _MAX_SEARCH_ATTEMPTS - 1:
+                    raise
+                delay = self._retry_delay(e, attempt)
+                logger.warning("Search failed (%s), retrying in %.2fs (attempt %d/%d)",
+                               e.status_code, delay, attempt + 1, _MAX_SEARCH_ATTEMPTS)
+                await asyncio.sleep(delay)
+    
+    @staticmethod
+    def _retry_delay(error: HttpResponseError, attempt: int) -> float:
+        """Seconds to wait before retrying: Retry-After if the service sent it, else jittered backoff"""
+        retry_after = error.response.headers.get('Retry-After') if error.response is not None else None
+        if retry_after:
+            try:
+                return min(30.0, float(retry_after))
+            except ValueError:
+                pass
+        return min(30.0, 0.25 * 2 ** attempt + random.random() * 0.25)
+    
+    async def _collect_results(self, results, state_field: str = None) -> list:
+        """Convert raw search hits into response dicts, tagging each with its state if state_field is given"""
+        search_results = []
+        async for result in results:
+            result_data = {
+                'content': result.get('content', ''),
+                'score': result.get('@search.score', 0),
+                'page_number': result.get('page_number', ''),
+                'parent_document': result.get('parent_document', ''),
+                'document_type': result.get('document_type', ''),
+                'metadata_title': result.get('metadata_title', ''),
+                'metadata_creation_date': result.get('metadata_creation_date', ''),
+                'storage_path': result.get('metadata_storage_path', '')
+            }
+            if state_field:
+                result_data['state'] = result.get(state_field, '')
+            
+            # Add highlights if available
+            highlights = result.get('@search.highlights', {})
+            if highlights:
+                result_data['highlights'] = highlights
+                
+                # Add convenient highlighted_content field
+                if 'content' in highlights:
+                    result_data['highlighted_content'] = ' ... '.join(highlights['content'])
+                
+                # Add convenient highlighted_title field
+                if 'metadata_title' in highlights:
+                    result_data['highlighted_title'] = highlights['metadata_title'][0] if highlights['metadata_title'] else None
+            
+            search_results.append(result_data)
+        return search_results
+    
+    @staticmethod
+    def _result_cache_key(**params) -> str:
+        """Build a stable cache key from the normalized search parameters"""
+        canonical = json.dumps(params, sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
     
     def _build_filter_string(self, filters: dict) -> str:
         """
@@ -212,28 +513,16 @@ class AzureSearchQuery:
             'page_number': '5',
             'metadata_creation_date': {'gte': '2024-01-01T00:00:00Z'}
         }
-        """
-        filter_parts = []
-        
-        for field, value in filters.items():
-            if isinstance(value, dict):
-                # Handle range queries
-                if 'gte' in value:
-                    filter_parts.append(f"{field} ge {value['gte']}")
-                if 'lte' in value:
-                    filter_parts.append(f"{field} le {value['lte']}")
-                if 'gt' in value:
-                    filter_parts.append(f"{field} gt {value['gt']}")
-                if 'lt' in value:
-                    filter_parts.append(f"{field} lt {value['lt']}")
-            else:
-                # Handle equality
-                filter_parts.append(f"{field} eq '{value}'")
         
-        return ' and '.join(filter_parts)
+        Fields are emitted in sorted order, so equal filter dicts always
+        produce the same expression and repeated shapes hit the builder cache
+        """
+        return _build_odata_filter(_canonical_filters(filters))
     
-    def search_multiple_states(self, query: str, state_codes: list = None, 
-                              top: int = None, filters: dict = None):
+    async def search_multiple_states(self, query: str, state_codes: list = None, 
+                                     top: int = None, filters: dict = None,
+                                     use_cache: bool = True, include_all: bool = True,
+                                     include_total_count: bool = False):
         """
         Search across multiple state indexes
         
@@ -242,6 +531,10 @@ class AzureSearchQuery:
             state_codes: List of state codes to search (default: all states)
             top: Number of results per state
             filters: Filters to apply
+            use_cache: Serve identical recent per-state queries from the result cache
+            include_all: Include every hit, sorted by score, as 'all_results'
+            include_total_count: Report each state's total match count (always
+                reported by the unified index, which gets it from a facet)
         
         Returns:
             Dictionary with combined results from all states
@@ -251,51 +544,291 @@ class AzureSearchQuery:
             if not state_codes:
                 state_codes = list(self.states.keys())
             
-            logger.info(f"Executing multi-state search across: {', '.join([s.upper() for s in state_codes])}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Executing multi-state search across: %s",
+                            ', '.join(s.upper() for s in state_codes))
+            
+            if self.unified_index:
+                return await self._search_unified_index(query, state_codes, top, filters,
+                                                        use_cache, include_all)
             
             all_results = []
             state_summaries = []
             
-            for state_code in state_codes:
-                try:
-                    result = self.search(query, state_code, top, filters)
-                    all_results.extend(result['results'])
-                    state_summaries.append({
-                        'state': state_code,
-                        'state_name': result['state_name'],
-                        'results_count': result['results_count'],
-                        'total_count': result['total_count']
-                    })
-                except Exception as e:
-                    logger.warning(f"Search failed for state {state_code}: {str(e)}")
+            # Each state is an independent round trip, so run them concurrently;
+            # gather keeps results in request order so the summaries stay stable
+            state_results = await asyncio.gather(
+                *(self.search(query, state_code, top, filters,
+                              include_total_count=include_total_count, use_cache=use_cache)
+                  for state_code in state_codes),
+                return_exceptions=True
+            )
+            
+            for state_code, result in zip(state_codes, state_results):
+                if isinstance(result, Exception):
+                    logger.warning("Search failed for state %s: %s", state_code, result)
                     state_summaries.append({
                         'state': state_code,
-                        'error': str(e)
+                        'error': str(result)
                     })
+                    continue
+                
+                all_results.extend(result['results'])
+                state_summaries.append({
+                    'state': state_code,
+                    'state_name': result['state_name'],
+                    'results_count': result['results_count'],
+                    'total_count': result['total_count']
+                })
             
-            # Sort all results by score
-            all_results.sort(key=lambda x: x['score'], reverse=True)
-            
-            # Return top results across all states
+            # Return top results across all states; a full sort is only
+            # needed when the caller wants every hit back
             top_k = top if top else self.top_k
+            score_key = operator.itemgetter('score')
+            if include_all:
+                all_results.sort(key=score_key, reverse=True)
+                top_results = all_results[:top_k]
+            else:
+                top_results = heapq.nlargest(top_k, all_results, key=score_key)
             
-            return {
+            response = {
                 'query': query,
                 'states_searched': state_codes,
                 'state_summaries': state_summaries,
                 'total_results': len(all_results),
-                'top_results': all_results[:top_k],
-                'all_results': all_results
+                'top_results': top_results
             }
+            if include_all:
+                response['all_results'] = all_results
+            return response
             
         except Exception as e:
             logger.error(f"Multi-state search failed: {str(e)}")
             raise
+    
+    async def _search_unified_index(self, query: str, state_codes: list, top: int,
+                                    filters: dict, use_cache: bool, include_all: bool):
+        """
+        Search several states with a single query against the unified index
+        
+        Hits come back ranked by the service in one pass, so no merge or sort
+        is needed; per-state totals come from a facet on the state field.
+        """
+        top_k = top if top else self.top_k
+        valid_codes = [code for code in state_codes if code in self._valid_states]
+        
+        cache_key = self._result_cache_key(
+            unified_index=self.unified_index, query=query, states=valid_codes,
+            top=top_k, filters=filters
+        )
+        cached = self._result_cache.get(cache_key) if use_cache else None
+        if cached is not None:
+            logger.info("Cache HIT for unified search: %r", query)
+            hits, state_totals = cached
+        elif valid_codes:
+            state_values = ','.join(_odata_escape(code) for code in valid_codes)
+            filter_parts = [f"search.in({self.unified_state_field}, '{state_values}', ',')"]
+            if filters:
+                filter_parts.append(self._build_filter_string(filters))
+            
+            hits, results = await self._run_query(
+                self._get_index_client(self.unified_index),
+                state_field=self.unified_state_field,
+                search_text=query,
+                filter=' and '.join(filter_parts),
+                top=top_k * len(valid_codes),
+                facets=[f"{self.unified_state_field},count:{len(valid_codes)}"],
+                select=_DEFAULT_SELECT + (self.unified_state_field,),
+                highlight_fields=_DEFAULT_HIGHLIGHT_CSV
+            )
+            facets = await results.get_facets() or {}
+            state_totals = {facet['value']: facet['count']
+                            for facet in facets.get(self.unified_state_field, [])}
+            self._result_cache.set(cache_key, (hits, state_totals))
+        else:
+            hits, state_totals = [], {}
+        
+        results_per_state = Counter(hit['state'] for hit in hits)
+        state_summaries = []
+        for state_code in state_codes:
+            if state_code not in self._valid_states:
+                state_summaries.append({
+                    'state': state_code,
+                    'error': f"Invalid state code: {state_code}"
+                })
+                continue
+            state_summaries.append({
+                'state': state_code,
+                'state_name': self.states[state_code]['name'],
+                'results_count': results_per_state[state_code],
+                'total_count': state_totals.get(state_code, 0)
+            })
+        
+        response = {
+            'query': query,
+            'states_searched': state_codes,
+            'state_summaries': state_summaries,
+            'total_results': len(hits),
+            'top_results': hits[:top_k]
+        }
+        if include_all:
+            response['all_results'] = hits
+        return response
+
+
+# Searchers are cached per config path so the config file, environment and
+# credential are resolved once per process instead of once per request.
+# The config path comes from the request, so only the most recently used
+# few are kept. An evicted searcher's clients and session are closed in the
+# background once no request is using it; handlers hold searchers through
+# use_searcher, which counts their users. All handlers run on the app's
+# single event loop, so no lock is needed.
+_MAX_SEARCHERS = 4
+_SEARCHERS: OrderedDict[str, AzureSearchQuery] = OrderedDict()
+_SEARCHER_USERS: dict[AzureSearchQuery, int] = {}
+_closing_searchers: set = set()
 
 
-# Flask API endpoints
+def _close_in_background(searcher: AzureSearchQuery):
+    """Close a searcher dropped from the cache without making the caller wait"""
+    task = asyncio.get_running_loop().create_task(searcher.close())
+    _closing_searchers.add(task)
+    task.add_done_callback(_closing_searchers.discard)
+
+
+def get_searcher(config_path: str = 'search_config.json') -> AzureSearchQuery:
+    """Return the shared AzureSearchQuery for a config path, creating it on first use"""
+    searcher = _SEARCHERS.get(config_path)
+    if searcher is not None:
+        _SEARCHERS.move_to_end(config_path)
+        return searcher
+    
+    searcher = AzureSearchQuery(config_path=config_path)
+    _SEARCHERS[config_path] = searcher
+    if len(_SEARCHERS) > _MAX_SEARCHERS:
+        _, evicted = _SEARCHERS.popitem(last=False)
+        if evicted not in _SEARCHER_USERS:
+            _close_in_background(evicted)
+    return searcher
+
+
+@asynccontextmanager
+async def use_searcher(config_path: str = 'search_config.json'):
+    """Hold the shared searcher for a config path; it is not closed while held"""
+    searcher = get_searcher(config_path)
+    _SEARCHER_USERS[searcher] = _SEARCHER_USERS.get(searcher, 0) + 1
+    try:
+        yield searcher
+    finally:
+        users = _SEARCHER_USERS.pop(searcher) - 1
+        if users:
+            _SEARCHER_USERS[searcher] = users
+        elif all(cached is not searcher for cached in _SEARCHERS.values()):
+            # Evicted while in use; nothing needs it any more
+            _close_in_background(searcher)
+
+
+def _render_states_payload(states: dict) -> tuple[bytes, str]:
+    """Render a states listing with its strong ETag"""
+    states_info = [
+        {
+            'code': code,
+            'name': info['name'],
+            'index': info['index'],
+            'container': info['container']
+        }
+        for code, info in states.items()
+    ]
+    body = orjson.dumps({
+        "total_states": len(states_info),
+        "states": states_info
+    })
+    return body, '"' + hashlib.md5(body).hexdigest() + '"'
+
+
+@functools.lru_cache(maxsize=16)
+def _read_states_payload(path: str, mtime_ns: int, size: int) -> tuple[bytes, str]:
+    """Render the states listing of a config file; keyed on its mtime and size so edits are picked up"""
+    with open(path, 'r') as f:
+        return _render_states_payload(json.load(f).get('states', {}))
+
+
+def _states_payload(config_path: str = 'search_config.json') -> tuple[bytes, str]:
+    """States listing for a config file, rendered once per version of the file; missing files aren't cached"""
+    try:
+        path = os.path.abspath(config_path)
+        stat = os.stat(path)
+        return _read_states_payload(path, stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        logger.warning("Config file %s not found, using defaults", config_path)
+        return _render_states_payload({})
+
+
+def _json_response(payload, status: int = 200):
+    """Serialize a payload with orjson directly into a JSON response"""
+    return app.response_class(orjson.dumps(payload), status=status, mimetype='application/json')
+
+
+_log_listener = None
+
+
+def _start_log_listener():
+    """
+    Route log records through a queue so handlers write them off the event loop
+    QueueHandler still interpolates each message on the calling thread; the
+    formatter and stream I/O run on the listener thread
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+    root = logging.getLogger()
+    log_queue = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    _log_listener.start()
+
+
+def _stop_log_listener():
+    """Flush queued log records and restore the original handlers"""
+    global _log_listener
+    if _log_listener is None:
+        return
+    _log_listener.stop()
+    logging.getLogger().handlers = list(_log_listener.handlers)
+    _log_listener = None
+
+
+@app.before_serving
+async def start_log_listener():
+    """Move log handler formatting and I/O onto a background thread while serving"""
+    _start_log_listener()
+
+
+@app.after_serving
+async def stop_log_listener():
+    """Drain the log queue on shutdown"""
+    _stop_log_listener()
+
+
+@app.before_serving
+async def warm_default_searcher():
+    """Create the default searcher so the first request doesn't pay for it"""
+    get_searcher()
+    _states_payload()
+
+
+@app.after_serving
+async def close_searchers():
+    """Close the cached searchers' clients and credentials on shutdown"""
+    for searcher in _SEARCHERS.values():
+        await searcher.close()
+    _SEARCHERS.clear()
+    await asyncio.gather(*_closing_searchers, return_exceptions=True)
+
+
+# Quart API endpoints
 @app.route('/api/search', methods=['POST'])
-def search_api():
+async def search_api():
     """
     API endpoint for single-state search
     
@@ -311,14 +844,17 @@ def search_api():
         "query_type": "simple",
         "highlight_fields": ["content", "metadata_title"],
         "highlight_pre_tag": "<mark>",
-        "highlight_post_tag": "</mark>"
+        "highlight_post_tag": "</mark>",
+        "include_total_count": true  // optional, count all matches (slower)
     }
+    
+    Pass ?no_cache=1 to bypass the result cache.
     """
     try:
         if not request.is_json:
             return jsonify({"error": "Request must be JSON"}), 400
         
-        data = request.json
+        data = await request.get_json()
         query = data.get('query')
         state_code = data.get('state')
         
@@ -336,22 +872,23 @@ def search_api():
         
         # Initialize search
         config_path = data.get('config_path', 'search_config.json')
-        searcher = AzureSearchQuery(config_path=config_path)
-        
-        # Execute search
-        results = searcher.search(
-            query=query,
-            state_code=state_code,
-            top=top,
-            filters=filters,
-            search_mode=search_mode,
-            query_type=query_type,
-            highlight_fields=highlight_fields,
-            highlight_pre_tag=highlight_pre_tag,
-            highlight_post_tag=highlight_post_tag
-        )
+        async with use_searcher(config_path) as searcher:
+            # Execute search
+            results = await searcher.search(
+                query=query,
+                state_code=state_code,
+                top=top,
+                filters=filters,
+                search_mode=search_mode,
+                query_type=query_type,
+                highlight_fields=highlight_fields,
+                highlight_pre_tag=highlight_pre_tag,
+                highlight_post_tag=highlight_post_tag,
+                include_total_count=data.get('include_total_count') is True,
+                use_cache=request.args.get('no_cache') != '1'
+            )
         
-        return jsonify(results), 200
+        return _json_response(results)
         
     except ValueError as e:
         return jsonify({"error": str(e)}), 400
@@ -361,7 +898,7 @@ def search_api():
 
 
 @app.route('/api/search/multi-state', methods=['POST'])
-def multi_state_search_api():
+async def multi_state_search_api():
     """
     API endpoint for multi-state search
     
@@ -372,14 +909,18 @@ def multi_state_search_api():
         "top": 10,
         "filters": {
             "document_type": "policy"
-        }
+        },
+        "include_all": false,  // optional, omit 'all_results' from the response
+        "include_total_count": true  // optional, count all matches per state (slower)
     }
+    
+    Pass ?no_cache=1 to bypass the result cache.
     """
     try:
         if not request.is_json:
             return jsonify({"error": "Request must be JSON"}), 400
         
-        data = request.json
+        data = await request.get_json()
         query = data.get('query')
         
         if not query:
@@ -389,20 +930,23 @@ def multi_state_search_api():
         state_codes = data.get('states')
         top = data.get('top')
         filters = data.get('filters')
+        include_all = data.get('include_all', True)
         
         # Initialize search
         config_path = data.get('config_path', 'search_config.json')
-        searcher = AzureSearchQuery(config_path=config_path)
-        
-        # Execute multi-state search
-        results = searcher.search_multiple_states(
-            query=query,
-            state_codes=state_codes,
-            top=top,
-            filters=filters
-        )
+        async with use_searcher(config_path) as searcher:
+            # Execute multi-state search
+            results = await searcher.search_multiple_states(
+                query=query,
+                state_codes=state_codes,
+                top=top,
+                filters=filters,
+                use_cache=request.args.get('no_cache') != '1',
+                include_all=include_all,
+                include_total_count=data.get('include_total_count') is True
+            )
         
-        return jsonify(results), 200
+        return _json_response(results)
         
     except Exception as e:
         logger.error(f"Multi-state search API failed: {str(e)}")
@@ -410,25 +954,17 @@ def multi_state_search_api():
 
 
 @app.route('/api/search/states', methods=['GET'])
-def list_states():
+async def list_states():
     """API endpoint to list available states"""
     try:
         config_path = request.args.get('config_path', 'search_config.json')
-        searcher = AzureSearchQuery(config_path=config_path)
-        
-        states_info = []
-        for code, info in searcher.states.items():
-            states_info.append({
-                'code': code,
-                'name': info['name'],
-                'index': info['index'],
-                'container': info['container']
-            })
+        body, etag = _states_payload(config_path)
+        headers = {'ETag': etag, 'Cache-Control': 'public, max-age=3600'}
+        
+        if etag in request.headers.get('If-None-Match', ''):
+            return app.response_class(status=304, headers=headers)
         
-        return jsonify({
-            "total_states": len(states_info),
-            "states": states_info
-        }), 200
+        return app.response_class(body, mimetype='application/json', headers=headers)
         
     except Exception as e:
         logger.error(f"List states failed: {str(e)}")
@@ -436,7 +972,7 @@ def list_states():
 
 
 @app.route('/api/health', methods=['GET'])
-def health_check():
+async def health_check():
     """Health check endpoint"""
     return jsonify({
         "status": "healthy",
@@ -444,6 +980,15 @@ def health_check():
     }), 200
 
 
+async def _cli_search(query: str, state_code: str, top: int = None):
+    """Run a single search for the CLI and release the client afterwards"""
+    searcher = AzureSearchQuery()
+    try:
+        return await searcher.search(query, state_code, top)
+    finally:
+        await searcher.close()
+
+
 def main():
     """Main function for command-line usage"""
     import sys
@@ -459,8 +1004,7 @@ def main():
     top = int(sys.argv[3]) if len(sys.argv) > 3 else None
     
     try:
-        searcher = AzureSearchQuery()
-        results = searcher.search(query, state_code, top)
+        results = asyncio.run(_cli_search(query, state_code, top))
         
         print(json.dumps(results, indent=2))
         
@@ -477,6 +1021,11 @@ if __name__ == "__main__":
         port = int(os.getenv('PORT', 5001))
         print(f"\n{'='*60}")
         print("Azure Search Query API Server")
-        print(f"Starting on http://0.0.0.0:{port}")
+        print(f"Starting on http://0.0.0.0:{port} (gunicorn -c gunicorn_conf.py asgi:app)")
         print(f"{'='*60}\n")
-        app.run(host='0.0.0.0', port=port, debug=False)
\ No newline at end of file
+        # Hand the process over to gunicorn so requests are served by several
+        # uvloop workers instead of the single-process development server. The
+        # config and app module are found next to this script, whatever the cwd
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        os.execvp('gunicorn', ['gunicorn', '-c', os.path.join(base_dir, 'gunicorn_conf.py'),
+                               '--pythonpath', base_dir, 'asgi:app'])
\ No newline at end of file
@@ -7,9 +7,26 @@ Updated to use User-Assigned Managed Identity for data source connections
 
 import os
 import json
+import asyncio
+import hashlib
+import zlib
+import functools
+import time
+import threading
+from dataclasses import dataclass
+from typing import Optional
+import orjson
 import requests
-from flask import Flask, jsonify, request
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+from quart import Quart, jsonify, request
+from quart.json.provider import DefaultJSONProvider
 from azure.core.credentials import AzureKeyCredential
+from azure.core.exceptions import ResourceNotFoundError
+from azure.core.pipeline.policies import SansIOHTTPPolicy
+from azure.core.pipeline.transport import RequestsTransport
 from azure.identity import DefaultAzureCredential
 from azure.search.documents.indexes import SearchIndexClient, SearchIndexerClient
 from azure.search.documents.indexes.models import (
@@ -25,7 +42,7 @@ from azure.search.documents.indexes.models import (
     FieldMapping,
     IndexingSchedule
 )
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
 import logging
 
 # Load environment variables from .env file
@@ -36,8 +53,354 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# Initialize Flask app
-app = Flask(__name__)
+
+class _OrjsonProvider(DefaultJSONProvider):
+    """Quart JSON provider that (de)serializes request and response bodies with orjson"""
+    
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes straight to the response instead of round-tripping through str
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, default=self.default), mimetype=self.mimetype)
+
+
+# Initialize Quart app
+app = Quart(__name__)
+app.json = _OrjsonProvider(app)
+
+# Banner line framing each setup phase in the (debug) log
+_SEPARATOR = "=" * 60
+
+
+# Field schema shared by every state index; built once at import since it
+# never varies. The SDK only reads these when serializing a request.
+_INDEX_FIELDS = (
+    SimpleField(name="metadata_storage_path", type=SearchFieldDataType.String, key=True, retrievable=True, filterable=False, sortable=False, facetable=False),
+    SearchableField(name="content", type=SearchFieldDataType.String, searchable=True, retrievable=True, filterable=False, sortable=False, facetable=False, analyzer_name="standard.lucene"),
+    SimpleField(name="state", type=SearchFieldDataType.String, retrievable=False, filterable=True, sortable=False, facetable=True),
+    SimpleField(name="page_number", type=SearchFieldDataType.String, retrievable=True, filterable=True),
+    SimpleField(name="total_pages", type=SearchFieldDataType.String, retrievable=False, filterable=False),
+    SimpleField(name="parent_document", type=SearchFieldDataType.String, retrievable=True, filterable=True, facetable=True),
+    SimpleField(name="document_type", type=SearchFieldDataType.String, retrievable=True, filterable=True, facetable=True),
+    SimpleField(name="uploaded_by", type=SearchFieldDataType.String, retrievable=False, filterable=True),
+    SimpleField(name="is_single_page", type=SearchFieldDataType.String, retrievable=False, filterable=True),
+    SimpleField(name="metadata_storage_content_type", type=SearchFieldDataType.String, retrievable=False),
+    SimpleField(name="metadata_storage_size", type=SearchFieldDataType.Int64, retrievable=False),
+    SimpleField(name="metadata_storage_last_modified", type=SearchFieldDataType.DateTimeOffset, retrievable=False, filterable=True, sortable=True),
+    SimpleField(name="metadata_storage_name", type=SearchFieldDataType.String, retrievable=False),
+    SimpleField(name="metadata_storage_file_extension", type=SearchFieldDataType.String, retrievable=False, filterable=True, facetable=True),
+    SimpleField(name="metadata_content_type", type=SearchFieldDataType.String, retrievable=False),
+    SimpleField(name="metadata_language", type=SearchFieldDataType.String, retrievable=False),
+    SimpleField(name="metadata_author", type=SearchFieldDataType.String, retrievable=False),
+    SearchableField(name="metadata_title", type=SearchFieldDataType.String, retrievable=True, searchable=True, filterable=False),
+    SimpleField(name="metadata_creation_date", type=SearchFieldDataType.DateTimeOffset, retrievable=True, sortable=True, filterable=True)
+)
+
+# Field mappings and parameters shared by every indexer
+_INDEXER_FIELD_MAPPINGS = (
+    FieldMapping(source_field_name="metadata_storage_path", target_field_name="metadata_storage_path", mapping_function={"name": "base64Encode"}),
+)
+
+_INDEXER_PARAMETERS = {
+    "batchSize": 10,
+    "maxFailedItems": 0,
+    "maxFailedItemsPerBatch": 0,
+    "configuration": {
+        "dataToExtract": "contentAndMetadata",
+        "parsingMode": "default",
+        "indexedFileNameExtensions": ".pdf,.docx,.doc,.txt,.html,.htm,.xml,.json",
+        "excludedFileNameExtensions": ".png,.jpg,.jpeg,.gif,.bmp,.tiff",
+        "failOnUnsupportedContentType": False,
+        "failOnUnprocessableDocument": False
+    }
+}
+
+# Serialized form of each field, compared against an existing index's fields
+_INDEX_FIELD_DEFINITIONS = tuple(field.as_dict() for field in _INDEX_FIELDS)
+
+# Data sources and indexers carry a hash of their definition in the
+# description field, so an unchanged resource can be recognised without
+# comparing secrets the service never returns
+_DEFINITION_HASH_PREFIX = 'setup-definition:'
+
+
+def _definition_description(resource) -> str:
+    """Return the description marking a resource with a stable hash of its definition"""
+    definition = resource.as_dict()
+    definition.pop('description', None)
+    canonical = json.dumps(definition, sort_keys=True, default=str)
+    return _DEFINITION_HASH_PREFIX + hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _index_fields_match(existing_index) -> bool:
+    """True if an existing index already has exactly the fields setup would create"""
+    existing_fields = [field.as_dict() for field in existing_index.fields or []]
+    if len(existing_fields) != len(_INDEX_FIELD_DEFINITIONS):
+        return False
+    # The service returns every attribute, so compare only the ones setup sets
+    return all(
+        all(existing.get(key) == value for key, value in desired.items())
+        for existing, desired in zip(existing_fields, _INDEX_FIELD_DEFINITIONS)
+    )
+
+
+# Indexer start times are offset from a fixed anchor by a stable hash of the
+# indexer name, so the wake-ups of all indexers spread across their interval
+# and the definition (and its hash) stays the same between setup runs
+_SCHEDULE_ANCHOR = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _indexer_schedule(indexer_name: str, interval_minutes: int) -> IndexingSchedule:
+    """Return a schedule for the indexer with a start time staggered within its interval"""
+    offset = zlib.crc32(indexer_name.encode('utf-8')) % (interval_minutes * 60)
+    return IndexingSchedule(
+        interval=timedelta(minutes=interval_minutes),
+        start_time=_SCHEDULE_ANCHOR + timedelta(seconds=offset)
+    )
+
+
+# azure-core retry settings for both clients: 429 and 503 responses (honouring
+# Retry-After) and connection errors back off exponentially from 0.5s
+_RETRY_SETTINGS = {
+    'retry_total': 5,
+    'retry_backoff_factor': 0.5,
+    'retry_backoff_max': 30,
+    'retry_mode': 'exponential'
+}
+
+_http_session = None
+_http_session_lock = threading.Lock()
+
+
+def _get_http_session() -> requests.Session:
+    """Return the process-wide requests session used by every Azure Search client, creating it on first use"""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            pool_size = int(get_env_config().pool_size or 32)
+            session = requests.Session()
+            # Retries are left to the azure-core retry policy, as in the SDK's own adapter
+            adapter = HTTPAdapter(
+                pool_connections=pool_size,
+                pool_maxsize=pool_size,
+                max_retries=Retry(total=False, redirect=False, raise_on_status=False)
+            )
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _http_session = session
+        return _http_session
+
+
+@functools.lru_cache(maxsize=16)
+def _read_config(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse a config file; keyed on its mtime and size so edits are picked up"""
+    with open(path, 'rb') as f:
+        config = orjson.loads(f.read())
+    logger.info("Configuration loaded from %s", path)
+    return config
+
+
+def load_config(config_path: str) -> dict:
+    """Load configuration from JSON file, reusing the parsed copy while the file is unchanged"""
+    try:
+        path = os.path.abspath(config_path)
+        stat = os.stat(path)
+        return _read_config(path, stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        logger.warning("Config file %s not found, using defaults", config_path)
+        return {}
+    except json.JSONDecodeError as e:
+        logger.error("Invalid JSON in config file: %s", e)
+        raise
+
+
+@dataclass(frozen=True)
+class EnvConfig:
+    """Snapshot of the environment variables setup reads; unset variables are None"""
+    search_endpoint: Optional[str]
+    search_key: Optional[str]
+    use_user_assigned_identity: bool
+    user_assigned_client_id: Optional[str]
+    storage_account_name: Optional[str]
+    storage_connection_string: Optional[str]
+    storage_key: Optional[str]
+    use_storage_managed_identity: bool
+    subscription_id: Optional[str]
+    resource_group: Optional[str]
+    managed_identity_resource_id: Optional[str]
+    top_k: Optional[str]
+    setup_concurrency: Optional[str]
+    indexer_interval: Optional[str]
+    common_indexer_interval: Optional[str]
+    pool_size: Optional[str]
+
+
+@functools.lru_cache(maxsize=1)
+def get_env_config() -> EnvConfig:
+    """Read the environment (after .env is loaded at import) once per process"""
+    return EnvConfig(
+        search_endpoint=os.getenv('AZURE_SEARCH_ENDPOINT'),
+        search_key=os.getenv('AZURE_SEARCH_KEY'),
+        use_user_assigned_identity=os.getenv('USE_USER_ASSIGNED_IDENTITY', 'false').lower() == 'true',
+        user_assigned_client_id=os.getenv('USER_ASSIGNED_CLIENT_ID'),
+        storage_account_name=os.getenv('AZURE_STORAGE_ACCOUNT_NAME'),
+        storage_connection_string=os.getenv('AZURE_STORAGE_CONNECTION_STRING'),
+        storage_key=os.getenv('AZURE_STORAGE_KEY'),
+        use_storage_managed_identity=os.getenv('USE_STORAGE_MANAGED_IDENTITY', 'false').lower() == 'true',
+        subscription_id=os.getenv('AZURE_SUBSCRIPTION_ID'),
+        resource_group=os.getenv('AZURE_RESOURCE_GROUP'),
+        managed_identity_resource_id=os.getenv('MANAGED_IDENTITY_RESOURCE_ID'),
+        top_k=os.getenv('AZURE_SEARCH_INDEX_TOP_K'),
+        setup_concurrency=os.getenv('AZURE_SEARCH_SETUP_CONCURRENCY'),
+        indexer_interval=os.getenv('AZURE_SEARCH_INDEXER_INTERVAL_MINUTES'),
+        common_indexer_interval=os.getenv('AZURE_SEARCH_COMMON_INDEXER_INTERVAL_MINUTES'),
+        pool_size=os.getenv('AZURE_SEARCH_POOL_SIZE')
+    )
+
+
+class _CachingTokenCredential:
+    """
+    Token credential wrapper that shares one token per scope between clients
+    
+    Each SDK client's bearer token policy keeps its own token, so two clients
+    on the same credential would each fetch one. Tokens are reused until they
+    are within five minutes of expiry, and the most recently used scope sets
+    are kept. When several threads need a fresh token at once, only the
+    first calls the credential; the rest wait for its result.
+    """
+    
+    _REFRESH_MARGIN = 300
+    _MAX_SCOPES = 16
+    
+    def __init__(self, credential):
+        self._credential = credential
+        self._tokens = OrderedDict()
+        self._in_flight = {}
+        self._lock = threading.Lock()
+    
+    def get_token(self, *scopes, **kwargs):
+        # Claims challenges and tenant overrides must always reach the credential
+        if kwargs.get('claims') or kwargs.get('tenant_id'):
+            return self._credential.get_token(*scopes, **kwargs)
+        
+        with self._lock:
+            token = self._tokens.get(scopes)
+            if token is not None and token.expires_on - time.time() > self._REFRESH_MARGIN:
+                self._tokens.move_to_end(scopes)
+                return token
+            pending = self._in_flight.get(scopes)
+            if pending is None:
+                pending = self._in_flight[scopes] = Future()
+                is_leader = True
+            else:
+                is_leader = False
+        
+        if not is_leader:
+            return pending.result()
+        
+        try:
+            token = self._credential.get_token(*scopes, **kwargs)
+        except BaseException as e:
+            with self._lock:
+                del self._in_flight[scopes]
+            pending.set_exception(e)
+            raise
+        
+        with self._lock:
+            self._tokens[scopes] = token
+            self._tokens.move_to_end(scopes)
+            while len(self._tokens) > self._MAX_SCOPES:
+                self._tokens.popitem(last=False)
+            del self._in_flight[scopes]
+        pending.set_result(token)
+        return token
+    
+    def close(self):
+        if hasattr(self._credential, 'close'):
+            self._credential.close()
+
+
+class _AdaptiveLimiter:
+    """
+    Bounds how many setup calls are in flight, adapting to throttling (AIMD)
+    
+    The bound halves whenever the service answers 429/503 and grows back by
+    one per completed call, up to its starting value.
+    """
+    
+    def __init__(self, limit: int):
+        self.max_limit = max(1, limit)
+        self.limit = self.max_limit
+        self._in_flight = 0
+        self._condition = threading.Condition()
+    
+    def __enter__(self):
+        with self._condition:
+            while self._in_flight >= self.limit:
+                self._condition.wait()
+            self._in_flight += 1
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        with self._condition:
+            self._in_flight -= 1
+            if exc_type is None and self.limit < self.max_limit:
+                self.limit += 1
+            self._condition.notify_all()
+    
+    def throttled(self):
+        """Halve the bound after a throttling response"""
+        with self._condition:
+            if self.limit > 1:
+                self.limit //= 2
+                logger.warning("Azure Search is throttling setup calls, lowering concurrency to %d", self.limit)
+
+
+class _ThrottleObserver(SansIOHTTPPolicy):
+    """Pipeline policy that reports each 429/503 attempt to the limiter; retrying stays with the retry policy"""
+    
+    def __init__(self, limiter: _AdaptiveLimiter):
+        self._limiter = limiter
+    
+    def on_response(self, request, response):
+        if response.http_response.status_code in (429, 503):
+            self._limiter.throttled()
+
+
+@functools.lru_cache(maxsize=4)
+def _get_token_credential(use_user_assigned_identity: bool, user_assigned_client_id: str):
+    """Select the managed identity credential once per process and identity settings.
+    
+    The result is wrapped in a _CachingTokenCredential, so every setup instance
+    built with the same settings also shares one token cache.
+    """
+    from azure.identity import ManagedIdentityCredential, ChainedTokenCredential
+    
+    if use_user_assigned_identity:
+        logger.info("Using User-Assigned Managed Identity: %s", user_assigned_client_id)
+        credential = ManagedIdentityCredential(client_id=user_assigned_client_id)
+    else:
+        # Same fallback order as before (system-assigned, then guruMA, then
+        # DefaultAzureCredential), but resolved on the first real API call
+        # instead of probing for a token here; the chain keeps the token
+        # of whichever credential succeeds for reuse
+        logger.info("Using System-Assigned Managed Identity with fallback to guruMA and DefaultAzureCredential")
+        credential = ChainedTokenCredential(
+            ManagedIdentityCredential(),
+            ManagedIdentityCredential(client_id=user_assigned_client_id),
+            DefaultAzureCredential()
+        )
+    
+    logger.debug(_SEPARATOR)
+    logger.info("Using Managed Identity authentication")
+    logger.debug(_SEPARATOR)
+    
+    return _CachingTokenCredential(credential)
 
 
 class AzureSearchSetup:
@@ -48,26 +411,33 @@ class AzureSearchSetup:
         # Load JSON configuration
         self.config = self._load_config(config_path)
         
+        # Environment variables take precedence over the config file
+        env = get_env_config()
+        
         # Azure Search Configuration
-        self.search_endpoint = os.getenv('AZURE_SEARCH_ENDPOINT', self.config.get('search_endpoint', 'https://gurusearchai.search.windows.net'))
-        self.search_key = os.getenv('AZURE_SEARCH_KEY')
-        self.use_user_assigned_identity = os.getenv('USE_USER_ASSIGNED_IDENTITY', 'false').lower() == 'true'
-        self.user_assigned_client_id = os.getenv('USER_ASSIGNED_CLIENT_ID', self.config.get('user_assigned_client_id', '6833750b-2598-4229-92a3-6d6d0df26e0f'))
+        self.search_endpoint = env.search_endpoint or self.config.get('search_endpoint', 'https://gurusearchai.search.windows.net')
+        self.search_key = env.search_key
+        self.use_user_assigned_identity = env.use_user_assigned_identity
+        self.user_assigned_client_id = env.user_assigned_client_id or self.config.get('user_assigned_client_id', '6833750b-2598-4229-92a3-6d6d0df26e0f')
         
         # Azure Storage Configuration
-        self.storage_account_name = os.getenv('AZURE_STORAGE_ACCOUNT_NAME', self.config.get('storage_account_name', 'gurustorageacct'))
-        self.storage_connection_string = os.getenv('AZURE_STORAGE_CONNECTION_STRING')
-        self.subscription_id = os.getenv('AZURE_SUBSCRIPTION_ID', self.config.get('subscription_id', 'e15576d7-67e8-4ed2-acab-42c5885ea1fd'))
-        self.resource_group = os.getenv('AZURE_RESOURCE_GROUP', self.config.get('resource_group', 'testpoc'))
+        self.storage_account_name = env.storage_account_name or self.config.get('storage_account_name', 'gurustorageacct')
+        self.storage_connection_string = env.storage_connection_string
+        self.storage_key = env.storage_key
+        self.use_storage_managed_identity = env.use_storage_managed_identity
+        self.subscription_id = env.subscription_id or self.config.get('subscription_id', 'e15576d7-67e8-4ed2-acab-42c5885ea1fd')
+        self.resource_group = env.resource_group or self.config.get('resource_group', 'testpoc')
         
         # User-Assigned Managed Identity Resource ID for data source
-        self.managed_identity_resource_id = os.getenv(
-            'MANAGED_IDENTITY_RESOURCE_ID',
+        self.managed_identity_resource_id = env.managed_identity_resource_id or (
             f"/subscriptions/{self.subscription_id}/resourcegroups/{self.resource_group}/providers/Microsoft.ManagedIdentity/userAssignedIdentities/guruMA"
         )
         
+        # ResourceId of the storage account, used by managed identity data sources
+        self.storage_resource_id = f"/subscriptions/{self.subscription_id}/resourceGroups/{self.resource_group}/providers/Microsoft.Storage/storageAccounts/{self.storage_account_name}"
+        
         # Search Configuration
-        self.top_k = int(os.getenv('AZURE_SEARCH_INDEX_TOP_K', self.config.get('top_k', 5)))
+        self.top_k = int(env.top_k or self.config.get('top_k', 5))
         
         # State configurations from JSON
         self.states = self.config.get('states', {})
@@ -75,36 +445,36 @@ class AzureSearchSetup:
         # Common container configuration
         self.common_container = self.config.get('common_container', 'guru-medicaid-common-sit')
         
+        # Indexer run intervals; the shared common container changes rarely
+        self.indexer_interval = int(env.indexer_interval or self.config.get('indexer_interval_minutes', 5))
+        self.common_indexer_interval = int(
+            env.common_indexer_interval or self.config.get('common_indexer_interval_minutes', 30)
+        )
+        
+        # Most states set up at once; kept low to stay under Azure Search throttling
+        self.setup_concurrency = int(env.setup_concurrency or self.config.get('setup_concurrency', 8))
+        self.limiter = _AdaptiveLimiter(self.setup_concurrency)
+        
         # Debug logging for environment variables
-        logger.info("=" * 60)
+        logger.debug(_SEPARATOR)
         logger.info("Environment Configuration Loaded:")
-        logger.info(f"  AZURE_SEARCH_ENDPOINT: {self.search_endpoint}")
-        logger.info(f"  AZURE_STORAGE_ACCOUNT_NAME: {self.storage_account_name}")
-        logger.info(f"  USE_STORAGE_MANAGED_IDENTITY: {os.getenv('USE_STORAGE_MANAGED_IDENTITY')}")
-        logger.info(f"  USE_USER_ASSIGNED_IDENTITY: {self.use_user_assigned_identity}")
-        logger.info(f"  USER_ASSIGNED_CLIENT_ID: {self.user_assigned_client_id}")
-        logger.info(f"  MANAGED_IDENTITY_RESOURCE_ID: {self.managed_identity_resource_id}")
-        logger.info(f"  AZURE_SUBSCRIPTION_ID: {self.subscription_id}")
-        logger.info(f"  AZURE_RESOURCE_GROUP: {self.resource_group}")
-        logger.info(f"  AZURE_SEARCH_KEY present: {'Yes' if self.search_key else 'No'}")
-        logger.info("=" * 60)
+        logger.info("  AZURE_SEARCH_ENDPOINT: %s", self.search_endpoint)
+        logger.info("  AZURE_STORAGE_ACCOUNT_NAME: %s", self.storage_account_name)
+        logger.info("  USE_STORAGE_MANAGED_IDENTITY: %s", self.use_storage_managed_identity)
+        logger.info("  USE_USER_ASSIGNED_IDENTITY: %s", self.use_user_assigned_identity)
+        logger.info("  USER_ASSIGNED_CLIENT_ID: %s", self.user_assigned_client_id)
+        logger.info("  MANAGED_IDENTITY_RESOURCE_ID: %s", self.managed_identity_resource_id)
+        logger.info("  AZURE_SUBSCRIPTION_ID: %s", self.subscription_id)
+        logger.info("  AZURE_RESOURCE_GROUP: %s", self.resource_group)
+        logger.info("  AZURE_SEARCH_KEY present: %s", 'Yes' if self.search_key else 'No')
+        logger.debug(_SEPARATOR)
         
         # Initialize clients
         self._initialize_clients()
     
     def _load_config(self, config_path):
         """Load configuration from JSON file"""
-        try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-                logger.info(f"Configuration loaded from {config_path}")
-                return config
-        except FileNotFoundError:
-            logger.warning(f"Config file {config_path} not found, using defaults")
-            return {}
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in config file: {str(e)}")
-            raise
+        return load_config(config_path)
     
     def _initialize_clients(self):
         """Initialize Azure Search clients with appropriate authentication"""
@@ -113,105 +483,80 @@ class AzureSearchSetup:
                 credential = AzureKeyCredential(self.search_key)
                 logger.info("Using API Key authentication")
             else:
-                from azure.identity import ManagedIdentityCredential, ChainedTokenCredential
-                
-                if self.use_user_assigned_identity:
-                    logger.info(f"Using User-Assigned Managed Identity: {self.user_assigned_client_id}")
-                    credential = ManagedIdentityCredential(client_id=self.user_assigned_client_id)
-                else:
-                    try:
-                        system_credential = ManagedIdentityCredential()
-                        logger.info("Testing System-Assigned Managed Identity authentication...")
-                        token = system_credential.get_token("https://search.azure.com/.default")
-                        logger.info(f"✓ Successfully acquired token using System-Assigned Managed Identity")
-                        logger.info(f"✓ Token expires at: {token.expires_on}")
-                        credential = system_credential
-                    except Exception as auth_error:
-                        logger.warning(f"System-assigned identity failed: {auth_error}")
-                        logger.info("Trying user-assigned managed identity: guruMA")
-                        user_credential = ManagedIdentityCredential(client_id=self.user_assigned_client_id)
-                        try:
-                            token = user_credential.get_token("https://search.azure.com/.default")
-                            logger.info(f"✓ Successfully acquired token using User-Assigned Managed Identity (guruMA)")
-                            credential = user_credential
-                        except Exception as user_error:
-                            logger.error(f"User-assigned identity also failed: {user_error}")
-                            logger.error("Falling back to DefaultAzureCredential")
-                            credential = DefaultAzureCredential()
-                
-                logger.info("=" * 60)
-                logger.info("Using Managed Identity authentication")
-                logger.info("=" * 60)
+                credential = _get_token_credential(
+                    self.use_user_assigned_identity, self.user_assigned_client_id
+                )
             
-            self.index_client = SearchIndexClient(endpoint=self.search_endpoint, credential=credential)
-            self.indexer_client = SearchIndexerClient(endpoint=self.search_endpoint, credential=credential)
+            # Both clients send over the process-wide pooled session so index, data
+            # source and indexer calls reuse the same keep-alive connections, and
+            # share one throttling-aware retry policy
+            self.index_client = SearchIndexClient(
+                endpoint=self.search_endpoint,
+                credential=credential,
+                transport=RequestsTransport(session=_get_http_session(), session_owner=False),
+                per_retry_policies=[_ThrottleObserver(self.limiter)],
+                **_RETRY_SETTINGS
+            )
+            self.indexer_client = SearchIndexerClient(
+                endpoint=self.search_endpoint,
+                credential=credential,
+                transport=RequestsTransport(session=_get_http_session(), session_owner=False),
+                per_retry_policies=[_ThrottleObserver(self.limiter)],
+                **_RETRY_SETTINGS
+            )
             logger.info("Azure Search clients initialized successfully")
         except Exception as e:
-            logger.error(f"Failed to initialize clients: {str(e)}")
+            logger.error("Failed to initialize clients: %s", e)
             raise
     
+    def close(self):
+        """Close the search clients; the pooled HTTP session and cached credential stay open"""
+        self.index_client.close()
+        self.indexer_client.close()
+    
+    @functools.cached_property
+    def _user_identity(self) -> SearchIndexerDataIdentity:
+        """User-assigned identity attached to managed identity data sources, built on first use"""
+        logger.info("Created SearchIndexerDataUserAssignedIdentity object")
+        return SearchIndexerDataIdentity(resource_id=self.managed_identity_resource_id)
+    
     def create_search_index(self, index_name: str, state_code: str) -> SearchIndex:
         """Create a search index with all required fields"""
         try:
-            logger.info(f"Creating search index: {index_name}")
+            logger.info("Creating search index: %s", index_name)
             
-            fields = [
-                SimpleField(name="metadata_storage_path", type=SearchFieldDataType.String, key=True, retrievable=True, filterable=False, sortable=False, facetable=False),
-                SearchableField(name="content", type=SearchFieldDataType.String, searchable=True, retrievable=True, filterable=False, sortable=False, facetable=False, analyzer_name="standard.lucene"),
-                SimpleField(name="state", type=SearchFieldDataType.String, retrievable=False, filterable=True, sortable=False, facetable=True),
-                SimpleField(name="page_number", type=SearchFieldDataType.String, retrievable=True, filterable=True),
-                SimpleField(name="total_pages", type=SearchFieldDataType.String, retrievable=False, filterable=False),
-                SimpleField(name="parent_document", type=SearchFieldDataType.String, retrievable=True, filterable=True, facetable=True),
-                SimpleField(name="document_type", type=SearchFieldDataType.String, retrievable=True, filterable=True, facetable=True),
-                SimpleField(name="uploaded_by", type=SearchFieldDataType.String, retrievable=False, filterable=True),
-                SimpleField(name="is_single_page", type=SearchFieldDataType.String, retrievable=False, filterable=True),
-                SimpleField(name="metadata_storage_content_type", type=SearchFieldDataType.String, retrievable=False),
-                SimpleField(name="metadata_storage_size", type=SearchFieldDataType.Int64, retrievable=False),
-                SimpleField(name="metadata_storage_last_modified", type=SearchFieldDataType.DateTimeOffset, retrievable=False, filterable=True, sortable=True),
-                SimpleField(name="metadata_storage_name", type=SearchFieldDataType.String, retrievable=False),
-                SimpleField(name="metadata_storage_file_extension", type=SearchFieldDataType.String, retrievable=False, filterable=True, facetable=True),
-                SimpleField(name="metadata_content_type", type=SearchFieldDataType.String, retrievable=False),
-                SimpleField(name="metadata_language", type=SearchFieldDataType.String, retrievable=False),
-                SimpleField(name="metadata_author", type=SearchFieldDataType.String, retrievable=False),
-                SearchableField(name="metadata_title", type=SearchFieldDataType.String, retrievable=True, searchable=True, filterable=False),
-                SimpleField(name="metadata_creation_date", type=SearchFieldDataType.DateTimeOffset, retrievable=True, sortable=True, filterable=True)
-            ]
+            existing = self._get_existing(self.index_client.get_index, index_name)
+            if existing is not None and _index_fields_match(existing):
+                logger.info("Index '%s' is unchanged, skipping update", index_name)
+                return existing
             
-            index = SearchIndex(name=index_name, fields=fields)
+            index = SearchIndex(name=index_name, fields=list(_INDEX_FIELDS))
             result = self.index_client.create_or_update_index(index)
-            logger.info(f"Index '{index_name}' created successfully")
+            logger.info("Index '%s' created successfully", index_name)
             return result
         except Exception as e:
-            logger.error(f"Failed to create index '{index_name}': {str(e)}")
+            logger.error("Failed to create index '%s': %s", index_name, e)
             raise
     
     def create_data_source_connection(self, datasource_name: str, container_name: str) -> SearchIndexerDataSourceConnection:
         """Create a data source connection to Azure Blob Storage using User-Assigned Managed Identity"""
         try:
-            logger.info(f"Creating data source connection: {datasource_name}")
-            
-            use_managed_identity = os.getenv('USE_STORAGE_MANAGED_IDENTITY', 'false').lower() == 'true'
+            logger.info("Creating data source connection: %s", datasource_name)
             
-            if use_managed_identity:
-                logger.info("=" * 60)
+            if self.use_storage_managed_identity:
+                logger.debug(_SEPARATOR)
                 logger.info("Using User-Assigned Managed Identity for storage authentication")
-                logger.info(f"Managed Identity Resource ID: {self.managed_identity_resource_id}")
+                logger.info("Managed Identity Resource ID: %s", self.managed_identity_resource_id)
                 
-                # Build ResourceId connection string for the storage account
-                storage_resource_id = f"/subscriptions/{self.subscription_id}/resourceGroups/{self.resource_group}/providers/Microsoft.Storage/storageAccounts/{self.storage_account_name}"
-                connection_string = f"ResourceId={storage_resource_id};"
+                # ResourceId connection string for the storage account
+                connection_string = f"ResourceId={self.storage_resource_id};"
                 
-                logger.info(f"Storage Resource ID: {storage_resource_id}")
-                logger.info(f"Container Name: {container_name}")
-                logger.info("=" * 60)
+                logger.info("Storage Resource ID: %s", self.storage_resource_id)
+                logger.info("Container Name: %s", container_name)
+                logger.debug(_SEPARATOR)
                 
-                # Create the User-Assigned Identity object with the correct resource_id parameter
-                user_assigned_identity = SearchIndexerDataIdentity(
-                    resource_id=self.managed_identity_resource_id
-                )
-                
-                logger.info(f"Created SearchIndexerDataUserAssignedIdentity object")
-                logger.info(f"Identity resource_id: {user_assigned_identity.resource_id}")
+                user_assigned_identity = self._user_identity
+                logger.info("Identity resource_id: %s", user_assigned_identity.resource_id)
                 
                 # Create container
                 container = SearchIndexerDataContainer(name=container_name, query=None)
@@ -226,11 +571,12 @@ class AzureSearchSetup:
                     identity=user_assigned_identity  # This is critical - without this, it defaults to system-assigned
                 )
                 
-                logger.info(f"Creating data source with identity: {data_source.identity}")
+                logger.info("Creating data source with identity: %s", data_source.identity)
                 
-                result = self.indexer_client.create_or_update_data_source_connection(data_source)
-                logger.info(f"✓ Data source '{datasource_name}' created successfully with User-Assigned Managed Identity")
-                logger.info(f"✓ Verify in Azure Portal that identity type is 'UserAssigned'")
+                result = self._put_if_changed(data_source, self.indexer_client.get_data_source_connection,
+                                              self.indexer_client.create_or_update_data_source_connection)
+                logger.info("✓ Data source '%s' created successfully with User-Assigned Managed Identity", datasource_name)
+                logger.info("✓ Verify in Azure Portal that identity type is 'UserAssigned'")
                 return result
                     
             elif self.storage_connection_string:
@@ -243,12 +589,13 @@ class AzureSearchSetup:
                     connection_string=connection_string,
                     container=container
                 )
-                result = self.indexer_client.create_or_update_data_source_connection(data_source)
-                logger.info(f"Data source '{datasource_name}' created successfully")
+                result = self._put_if_changed(data_source, self.indexer_client.get_data_source_connection,
+                                              self.indexer_client.create_or_update_data_source_connection)
+                logger.info("Data source '%s' created successfully", datasource_name)
                 return result
             else:
                 logger.info("Using storage account key for authentication")
-                storage_key = os.getenv('AZURE_STORAGE_KEY')
+                storage_key = self.storage_key
                 if not storage_key:
                     raise ValueError("Storage authentication not configured. Please set either AZURE_STORAGE_CONNECTION_STRING, AZURE_STORAGE_KEY, or USE_STORAGE_MANAGED_IDENTITY=true")
                 connection_string = f"DefaultEndpointsProtocol=https;AccountName={self.storage_account_name};AccountKey={storage_key};EndpointSuffix=core.windows.net"
@@ -259,51 +606,104 @@ class AzureSearchSetup:
                     connection_string=connection_string,
                     container=container
                 )
-                result = self.indexer_client.create_or_update_data_source_connection(data_source)
-                logger.info(f"Data source '{datasource_name}' created successfully")
+                result = self._put_if_changed(data_source, self.indexer_client.get_data_source_connection,
+                                              self.indexer_client.create_or_update_data_source_connection)
+                logger.info("Data source '%s' created successfully", datasource_name)
                 return result
                 
         except Exception as e:
-            logger.error(f"Failed to create data source '{datasource_name}': {str(e)}")
+            logger.error("Failed to create data source '%s': %s", datasource_name, e)
             raise
     
-    def create_indexer(self, indexer_name: str, index_name: str, datasource_name: str) -> SearchIndexer:
+    def create_indexer(self, indexer_name: str, index_name: str, datasource_name: str,
+                       interval_minutes: Optional[int] = None) -> SearchIndexer:
         """Create an indexer to populate the search index from blob storage"""
         try:
-            logger.info(f"Creating indexer: {indexer_name}")
-            
-            field_mappings = [FieldMapping(source_field_name="metadata_storage_path", target_field_name="metadata_storage_path", mapping_function={"name": "base64Encode"})]
-            
-            indexer_parameters = {
-                "batchSize": 10,
-                "maxFailedItems": 0,
-                "maxFailedItemsPerBatch": 0,
-                "configuration": {
-                    "dataToExtract": "contentAndMetadata",
-                    "parsingMode": "default",
-                    "indexedFileNameExtensions": ".pdf,.docx,.doc,.txt,.html,.htm,.xml,.json",
-                    "excludedFileNameExtensions": ".png,.jpg,.jpeg,.gif,.bmp,.tiff",
-                    "failOnUnsupportedContentType": False,
-                    "failOnUnprocessableDocument": False
-                }
-            }
+            logger.info("Creating indexer: %s", indexer_name)
             
             indexer = SearchIndexer(
                 name=indexer_name,
                 data_source_name=datasource_name,
                 target_index_name=index_name,
-                field_mappings=field_mappings,
-                parameters=indexer_parameters,
-                schedule=IndexingSchedule(interval=timedelta(minutes=5))
+                field_mappings=list(_INDEXER_FIELD_MAPPINGS),
+                parameters=_INDEXER_PARAMETERS,
+                schedule=_indexer_schedule(indexer_name, interval_minutes or self.indexer_interval)
             )
             
-            result = self.indexer_client.create_or_update_indexer(indexer)
-            logger.info(f"Indexer '{indexer_name}' created successfully")
+            result = self._put_if_changed(indexer, self.indexer_client.get_indexer,
+                                          self.indexer_client.create_or_update_indexer)
+            logger.info("Indexer '%s' created successfully", indexer_name)
             return result
         except Exception as e:
-            logger.error(f"Failed to create indexer '{indexer_name}': {str(e)}")
+            logger.error("Failed to create indexer '%s': %s", indexer_name, e)
             raise
     
+    def _get_existing(self, get, name: str):
+        """Fetch a resource by name, returning None if it doesn't exist or can't be read"""
+        try:
+            return get(name)
+        except ResourceNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("Could not read existing '%s', updating unconditionally: %s", name, e)
+            return None
+    
+    def _put_if_changed(self, resource, get, put):
+        """Create or update a data source or indexer unless the service already has this definition"""
+        resource.description = _definition_description(resource)
+        existing = self._get_existing(get, resource.name)
+        if existing is not None and existing.description == resource.description:
+            logger.info("'%s' is unchanged, skipping update", resource.name)
+            return existing
+        return put(resource)
+    
+    def _run_step(self, create, *args):
+        """Run one create_* call once the adaptive limiter has a free slot"""
+        with self.limiter:
+            return create(*args)
+    
+    def _run_state_steps(self, executor: ThreadPoolExecutor, common_datasource_name: str) -> dict:
+        """
+        Submit every state's PUTs to the executor and wait for them
+        
+        Indexes and state data sources have no dependencies, so they all go
+        out at once; a state's two indexers follow as soon as its index and
+        data source exist. Returns each state's futures, keyed by state code.
+        """
+        outcomes = {}
+        pending = {}
+        for code, state_info in self.states.items():
+            logger.info("Setting up search resources for %s (%s)", state_info['name'], code.upper())
+            prerequisites = [
+                executor.submit(self._run_step, self.create_search_index, state_info['index'], code),
+                executor.submit(self._run_step, self.create_data_source_connection,
+                                f"datasource-{code}", state_info['container'])
+            ]
+            outcomes[code] = prerequisites
+            for future in prerequisites:
+                pending[future] = code
+        
+        for future in as_completed(list(pending)):
+            code = pending.pop(future)
+            state_steps = outcomes[code]
+            # Both prerequisites can already be done when the first is yielded,
+            # so the indexers are submitted only while the list holds just those two
+            if len(state_steps) > 2:
+                continue
+            if any(not f.done() for f in state_steps) or any(f.exception() for f in state_steps):
+                continue
+            index_name = self.states[code]['index']
+            state_steps.extend([
+                executor.submit(self._run_step, self.create_indexer,
+                                f"indexer-{code}", index_name, f"datasource-{code}"),
+                executor.submit(self._run_step, self.create_indexer,
+                                f"indexer-{code}-common", index_name, common_datasource_name,
+                                self.common_indexer_interval)
+            ])
+        
+        wait([f for state_steps in outcomes.values() for f in state_steps])
+        return outcomes
+    
     def setup_all_from_config(self):
         """Run the complete setup process for all states defined in config"""
         results = {"success": [], "failed": []}
@@ -311,77 +711,131 @@ class AzureSearchSetup:
         try:
             # Create common data source once
             common_datasource_name = "datasource-common"
-            logger.info(f"\n{'='*60}")
-            logger.info(f"Creating common data source for container: {self.common_container}")
-            logger.info(f"{'='*60}")
+            logger.debug("\n%s", _SEPARATOR)
+            logger.info("Creating common data source for container: %s", self.common_container)
+            logger.debug(_SEPARATOR)
             
             try:
                 self.create_data_source_connection(common_datasource_name, self.common_container)
-                logger.info(f"✓ Common data source created successfully")
+                logger.info("✓ Common data source created successfully")
             except Exception as e:
-                logger.error(f"✗ Failed to create common data source: {str(e)}")
+                logger.error("✗ Failed to create common data source: %s", e)
                 results["failed"].append({"resource": "common_datasource", "error": str(e)})
             
-            # Setup resources for each state
-            for code, state_info in self.states.items():
-                try:
-                    logger.info(f"\n{'='*60}")
-                    logger.info(f"Setting up search resources for {state_info['name']} ({code.upper()})")
-                    logger.info(f"{'='*60}")
-                    
-                    # Create index
-                    self.create_search_index(state_info['index'], code)
-                    
-                    # Create state-specific data source
-                    state_datasource_name = f"datasource-{code}"
-                    self.create_data_source_connection(state_datasource_name, state_info['container'])
-                    
-                    # Create state-specific indexer
-                    state_indexer_name = f"indexer-{code}"
-                    self.create_indexer(state_indexer_name, state_info['index'], state_datasource_name)
-                    
-                    # Create common indexer for this state
-                    common_indexer_name = f"indexer-{code}-common"
-                    self.create_indexer(common_indexer_name, state_info['index'], common_datasource_name)
-                    
-                    logger.info(f"✓ Setup completed for {state_info['name']}")
-                    results["success"].append({
-                        "state": code, 
-                        "name": state_info['name'],
-                        "index": state_info['index'],
-                        "datasources": [state_datasource_name, common_datasource_name],
-                        "indexers": [state_indexer_name, common_indexer_name]
-                    })
-                except Exception as e:
-                    logger.error(f"✗ Setup failed for {state_info['name']}: {str(e)}")
-                    results["failed"].append({"state": code, "name": state_info['name'], "error": str(e)})
+            # Every PUT runs as its own step on a shared pool, gated by the adaptive
+            # limiter; results are collected in config order so the response stays stable
+            if self.states:
+                with ThreadPoolExecutor(max_workers=max(1, self.setup_concurrency)) as executor:
+                    for code, outcome in self._run_state_steps(executor, common_datasource_name).items():
+                        state_info = self.states[code]
+                        error = next((f.exception() for f in outcome if f.exception() is not None), None)
+                        if error is None:
+                            logger.info("✓ Setup completed for %s", state_info['name'])
+                            results["success"].append({
+                                "state": code, 
+                                "name": state_info['name'],
+                                "index": state_info['index'],
+                                "datasources": [f"datasource-{code}", common_datasource_name],
+                                "indexers": [f"indexer-{code}", f"indexer-{code}-common"]
+                            })
+                        else:
+                            logger.error("✗ Setup failed for %s: %s", state_info['name'], error)
+                            results["failed"].append({"state": code, "name": state_info['name'], "error": str(error)})
             
-            logger.info(f"\n{'='*60}")
+            logger.debug("\n%s", _SEPARATOR)
             logger.info("All setup operations completed!")
-            logger.info(f"Total indexes created: {len([s for s in results['success'] if 'state' in s])}")
-            logger.info(f"Total data sources created: {len([s for s in results['success'] if 'state' in s]) + 1}")
-            logger.info(f"Total indexers created: {len([s for s in results['success'] if 'state' in s]) * 2}")
-            logger.info(f"{'='*60}\n")
+            if logger.isEnabledFor(logging.INFO):
+                states_done = sum(1 for entry in results['success'] if 'state' in entry)
+                logger.info("Total indexes created: %d", states_done)
+                logger.info("Total data sources created: %d", states_done + 1)
+                logger.info("Total indexers created: %d", states_done * 2)
+            logger.debug("%s\n", _SEPARATOR)
             return results
         except Exception as e:
-            logger.error(f"Setup failed: {str(e)}")
+            logger.error("Setup failed: %s", e)
             raise
 
 
-# Flask API endpoints
+# Setup instances are cached per config path so the credential and clients,
+# and the tokens they hold, are reused across requests. An instance is
+# rebuilt when its config file changes (or appears or disappears). The config
+# path comes from the request, so only the most recently used few are kept.
+# A replaced or evicted setup is closed once no request is using it, tracked
+# by acquire_setup/release_setup. Setup runs on worker threads off the event
+# loop, so the cache is guarded by a lock.
+_MAX_SETUPS = 4
+_SETUPS: OrderedDict[str, tuple[tuple, AzureSearchSetup]] = OrderedDict()
+_SETUP_USERS: dict[AzureSearchSetup, int] = {}
+_SETUPS_LOCK = threading.Lock()
+
+
+def _config_file_key(config_path: str) -> tuple:
+    """(absolute path, mtime_ns, size) of a config file; a missing file has no mtime or size"""
+    path = os.path.abspath(config_path)
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return path, None, None
+    return path, stat.st_mtime_ns, stat.st_size
+
+
+def _retire_setup(setup: AzureSearchSetup):
+    """Close a setup dropped from the cache unless a request still uses it; call with the lock held"""
+    if setup not in _SETUP_USERS:
+        setup.close()
+
+
+def acquire_setup(config_path: str = 'search_config.json') -> AzureSearchSetup:
+    """Return the shared AzureSearchSetup for a config path, creating it on first use; pair with release_setup"""
+    key = _config_file_key(config_path)
+    with _SETUPS_LOCK:
+        cached = _SETUPS.get(config_path)
+        if cached is not None and cached[0] == key:
+            setup = cached[1]
+        else:
+            setup = AzureSearchSetup(config_path=config_path)
+            _SETUPS[config_path] = (key, setup)
+            if cached is not None:
+                _retire_setup(cached[1])
+        _SETUPS.move_to_end(config_path)
+        if len(_SETUPS) > _MAX_SETUPS:
+            _, (_, evicted) = _SETUPS.popitem(last=False)
+            _retire_setup(evicted)
+        _SETUP_USERS[setup] = _SETUP_USERS.get(setup, 0) + 1
+        return setup
+
+
+def release_setup(setup: AzureSearchSetup):
+    """Mark one use of a setup finished, closing it if it has since left the cache"""
+    with _SETUPS_LOCK:
+        users = _SETUP_USERS.pop(setup) - 1
+        if users:
+            _SETUP_USERS[setup] = users
+        elif not any(cached_setup is setup for _, cached_setup in _SETUPS.values()):
+            setup.close()
+
+
+# Quart API endpoints
 @app.route('/api/setup', methods=['POST'])
-def setup_resources():
+async def setup_resources():
     """API endpoint to trigger setup of all search resources from config"""
     try:
-        # Ensure .env is loaded (in case working directory changed)
-        load_dotenv(override=True)
-        logger.info(f"API endpoint triggered - USE_USER_ASSIGNED_IDENTITY: {os.getenv('USE_USER_ASSIGNED_IDENTITY')}")
-        logger.info(f"API endpoint triggered - USER_ASSIGNED_CLIENT_ID: {os.getenv('USER_ASSIGNED_CLIENT_ID')}")
+        # .env is loaded once at import and the environment snapshotted on
+        # first use, so nothing is re-read per request
+        env = get_env_config()
+        logger.info("API endpoint triggered - USE_USER_ASSIGNED_IDENTITY: %s", env.use_user_assigned_identity)
+        logger.info("API endpoint triggered - USER_ASSIGNED_CLIENT_ID: %s", env.user_assigned_client_id)
         
-        config_path = request.json.get('config_path', 'search_config.json') if request.is_json else 'search_config.json'
+        data = await request.get_json() if request.is_json else None
+        config_path = (data or {}).get('config_path', 'search_config.json')
         
-        setup = AzureSearchSetup(config_path=config_path)
-        results = setup.setup_all_from_config()
+        # Setup is blocking SDK I/O; run it on a worker thread so the event
+        # loop keeps serving other requests (including health checks) meanwhile
+        setup = await asyncio.to_thread(acquire_setup, config_path)
+        try:
+            results = await asyncio.to_thread(setup.setup_all_from_config)
+        finally:
+            await asyncio.to_thread(release_setup, setup)
         
         return jsonify({
             "status": "completed",
@@ -389,7 +843,7 @@ def setup_resources():
             "results": results
         }), 200
     except Exception as e:
-        logger.error(f"API setup failed: {str(e)}")
+        logger.error("API setup failed: %s", e)
         return jsonify({
             "status": "error",
             "message": str(e)
@@ -397,11 +851,15 @@ def setup_resources():
 
 
 @app.route('/api/health', methods=['GET'])
-def health_check():
+async def health_check():
     """Health check endpoint"""
     return jsonify({"status": "healthy", "service": "Azure Search Setup API"}), 200
 
 
 if __name__ == "__main__":
+    import uvicorn
+    
+    # Equivalent to: uvicorn azure_search_setup_API_5:app --workers 1 --loop uvloop
+    # ("auto" picks uvloop when it is installed)
     port = int(os.getenv('PORT', 5000))
-    app.run(host='0.0.0.0', port=port, debug=False)
\ No newline at end of file
+    uvicorn.run(app, host='0.0.0.0', port=port, loop='auto', workers=1)
\ No newline at end of file
@@ -0,0 +1,25 @@
+"""
+Gunicorn configuration for the Azure Search Query API
+Launch with: gunicorn -c gunicorn_conf.py asgi:app
+"""
+
+import os
+import multiprocessing
+
+# Bind to the same PORT the dev server used
+bind = f"0.0.0.0:{os.getenv('PORT', 5001)}"
+
+# The Quart app is ASGI, so each worker runs its own uvloop event loop via
+# uvicorn; concurrency within a worker comes from the event loop, not threads
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'uvicorn.workers.UvicornWorker')
+workers = int(os.getenv('WEB_CONCURRENCY', 2 * multiprocessing.cpu_count() + 1))
+
+# Hold client connections open between requests, matching the keep-alive
+# used on the outbound Azure Search connection pool
+keepalive = 75
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 120))
+graceful_timeout = 30
+
+accesslog = '-'
+errorlog = '-'
+loglevel = os.getenv('GUNICORN_LOG_LEVEL', 'info')
\ No newline at end of file
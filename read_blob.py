@@ -1,4 +1,7 @@
-from azure.identity import DefaultAzureCredential
+import os
+import sys
+import codecs
+from azure.identity import AzureCliCredential, ManagedIdentityCredential
 from azure.storage.blob import BlobServiceClient
 
 # -------------------------
@@ -14,7 +17,13 @@ account_url = f"https://gurustorageacct.blob.core.windows.net"
 # -------------------------
 # Authenticate using Managed Identity / Azure CLI
 # -------------------------
-credential = DefaultAzureCredential()
+# Pick the credential directly rather than walking DefaultAzureCredential's
+# chain: App Service / Container Apps expose IDENTITY_ENDPOINT, and
+# USE_MANAGED_IDENTITY=true forces it elsewhere (e.g. on a VM)
+if os.getenv('IDENTITY_ENDPOINT') or os.getenv('USE_MANAGED_IDENTITY', 'false').lower() == 'true':
+    credential = ManagedIdentityCredential(client_id=os.getenv('USER_ASSIGNED_CLIENT_ID'))
+else:
+    credential = AzureCliCredential()
 
 blob_service_client = BlobServiceClient(
     account_url=account_url,
@@ -29,10 +38,13 @@ blob_client = blob_service_client.get_blob_client(
     blob=BLOB_NAME
 )
 
-blob_data = blob_client.download_blob().readall()
-
-# Convert bytes to string
-text_content = blob_data.decode("utf-8")
+# Stream the blob chunk by chunk and decode each one as it arrives, instead
+# of holding the whole file (and a decoded copy) in memory
+downloader = blob_client.download_blob()
+decoder = codecs.getincrementaldecoder("utf-8")()
 
 print("File contents:")
-print(text_content)
+for chunk in downloader.chunks():
+    sys.stdout.write(decoder.decode(chunk))
+sys.stdout.write(decoder.decode(b"", final=True))
+print()
\ No newline at end of file
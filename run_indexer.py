@@ -5,18 +5,111 @@ Supports dual indexers per state: state-specific and common container
 """
 
 import os
-from azure.core.credentials import AzureKeyCredential
-from azure.identity import DefaultAzureCredential
-from azure.search.documents.indexes import SearchIndexerClient
+import sys
+import asyncio
+import random
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import TYPE_CHECKING
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from types import MappingProxyType
+
+# The Azure SDK is imported where it is first used, so importing this module
+# (e.g. for STATES) stays fast
+if TYPE_CHECKING:
+    from azure.core.exceptions import HttpResponseError
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class IndexerPair:
+    """Names of a state's state-specific and common container indexers"""
+    state: str
+    common: str
+
+
+@dataclass(frozen=True, slots=True)
+class StateConfig:
+    """A state's display name and its dual indexers"""
+    name: str
+    indexers: IndexerPair
+
+
+# State configurations with dual indexers
+STATES = MappingProxyType({
+    'ia': StateConfig('Iowa', IndexerPair('indexer-ia', 'indexer-ia-common')),
+    'in': StateConfig('Indiana', IndexerPair('indexer-in', 'indexer-in-common')),
+    'oh': StateConfig('Ohio', IndexerPair('indexer-oh', 'indexer-oh-common')),
+    'tx': StateConfig('Texas', IndexerPair('indexer-tx', 'indexer-tx-common')),
+    'va': StateConfig('Virginia', IndexerPair('indexer-va', 'indexer-va-common')),
+    'wa': StateConfig('Washington', IndexerPair('indexer-wa', 'indexer-wa-common')),
+})
+STATE_CODES = frozenset(STATES)
+
+
+def _normalize_state_code(state_code: str) -> str:
+    """Accept state codes as typed by users, e.g. 'IA' or ' ia '"""
+    return state_code.strip().lower()
+
+
+# Most indexer requests the async runners keep in flight at once
+_MAX_CONCURRENT_REQUESTS = 6
+
+# Connections the async runners' aiohttp session keeps open to the service
+_ASYNC_POOL_SIZE = 32
+
+# Guards the first creation of the shared sync client, which run_indexer's
+# worker threads can request at the same time
+_CLIENT_LOCK = threading.Lock()
+
+# Indexer execution results after which a run is over
+_TERMINAL_STATUSES = ('success', 'transientFailure', 'persistentFailure')
+
+# run_indexer retries: throttling responses back off exponentially from
+# _RETRY_BASE_DELAY seconds (or wait as long as Retry-After asks), and a run
+# rejected because the previous one is still in progress waits for it to end.
+# run_indexer calls leave error responses to these retries (retry_status=0) so
+# a throttled run isn't also retried by the SDK's own policy; other calls keep
+# the SDK's retries. The codes are the ones that policy would have retried
+_RUN_MAX_ATTEMPTS = 5
+_RETRY_BASE_DELAY = 1.0
+_RETRYABLE_STATUS_CODES = (408, 429, 500, 502, 503, 504)
+_IN_PROGRESS_POLL_INTERVAL = 10
+_IN_PROGRESS_MAX_POLLS = 30
+
+
+def _retry_delay(error: 'HttpResponseError', attempt: int) -> float:
+    """Seconds to wait before retrying a throttled request"""
+    retry_after = 0.0
+    if error.response is not None:
+        try:
+            retry_after = float(error.response.headers.get('Retry-After', 0))
+        except (TypeError, ValueError):
+            pass  # HTTP-date form; fall back to backoff
+    return max(retry_after, _RETRY_BASE_DELAY * 2 ** attempt + random.uniform(0, _RETRY_BASE_DELAY))
+
+
+def _should_retry(error: 'HttpResponseError', attempt: int) -> bool:
+    """True if a failed run_indexer call is worth another attempt"""
+    from azure.core.exceptions import ResourceExistsError
+    
+    if attempt >= _RUN_MAX_ATTEMPTS - 1:
+        return False
+    return isinstance(error, ResourceExistsError) or error.status_code in _RETRYABLE_STATUS_CODES
+
+
+def _in_progress(status) -> bool:
+    """True if the indexer's latest execution hasn't finished"""
+    return status.last_result is not None and status.last_result.status == 'inProgress'
+
+
 class AzureIndexerRunner:
     """Handles running and monitoring Azure Search indexers"""
     
@@ -24,75 +117,166 @@ class AzureIndexerRunner:
         """Initialize with configuration from environment variables"""
         self.search_endpoint = os.getenv('AZURE_SEARCH_ENDPOINT', 'https://gurusearchai.search.windows.net')
         self.search_key = os.getenv('AZURE_SEARCH_KEY')  # Leave None for Entra auth
+        self.states = STATES  # Read-only, shared by all runners
         
-        # State configurations with dual indexers
-        self.states = {
-            'ia': {
-                'name': 'Iowa',
-                'indexers': {
-                    'state': 'indexer-ia',
-                    'common': 'indexer-ia-common'
-                }
-            },
-            'in': {
-                'name': 'Indiana',
-                'indexers': {
-                    'state': 'indexer-in',
-                    'common': 'indexer-in-common'
-                }
-            },
-            'oh': {
-                'name': 'Ohio',
-                'indexers': {
-                    'state': 'indexer-oh',
-                    'common': 'indexer-oh-common'
-                }
-            },
-            'tx': {
-                'name': 'Texas',
-                'indexers': {
-                    'state': 'indexer-tx',
-                    'common': 'indexer-tx-common'
-                }
-            },
-            'va': {
-                'name': 'Virginia',
-                'indexers': {
-                    'state': 'indexer-va',
-                    'common': 'indexer-va-common'
-                }
-            },
-            'wa': {
-                'name': 'Washington',
-                'indexers': {
-                    'state': 'indexer-wa',
-                    'common': 'indexer-wa-common'
-                }
-            }
-        }
-        
-        # Initialize client
-        self._initialize_client()
+        # The sync client is created on first use, so runs that only use the
+        # async methods never build it
+        self._indexer_client = None
+    
+    @property
+    def indexer_client(self):
+        """Shared sync indexer client, initialized on first access"""
+        if self._indexer_client is None:
+            with _CLIENT_LOCK:
+                if self._indexer_client is None:
+                    self._initialize_client()
+        return self._indexer_client
     
     def _initialize_client(self):
         """Initialize Azure Search indexer client with appropriate authentication"""
         try:
-            # Use Microsoft Entra (Azure AD) authentication if no key provided
-            if self.search_key:
-                credential = AzureKeyCredential(self.search_key)
-            else:
-                credential = DefaultAzureCredential()
+            # Use Microsoft Entra (Azure AD) authentication if no key provided;
+            # the client and credential are shared by every runner in the process
+            from _client_cache import get_indexer_client
             
-            self.indexer_client = SearchIndexerClient(
-                endpoint=self.search_endpoint,
-                credential=credential
-            )
+            self._indexer_client = get_indexer_client(self.search_endpoint, self.search_key)
             
             logger.info("Azure Search indexer client initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize client: {str(e)}")
             raise
     
+    def _is_running(self, indexer_name: str) -> bool:
+        """True if the indexer has an execution in progress; unknown counts as not running"""
+        try:
+            return _in_progress(self.indexer_client.get_indexer_status(indexer_name))
+        except Exception as e:
+            logger.warning(f"Could not check whether '{indexer_name}' is running: {str(e)}")
+            return False
+    
+    def _start_indexer(self, indexer_name: str):
+        """Run an indexer unless its previous execution is still in progress"""
+        if self._is_running(indexer_name):
+            logger.info(f"✓ Indexer '{indexer_name}' is already running, skipping")
+            return
+        self._run_with_retry(indexer_name)
+        logger.info(f"✓ Indexer '{indexer_name}' started successfully")
+    
+    async def _start_indexer_async(self, client, indexer_name: str) -> bool:
+        """Async counterpart of _start_indexer; returns False if the indexer was already running"""
+        try:
+            running = _in_progress(await client.get_indexer_status(indexer_name))
+        except Exception as e:
+            logger.warning(f"Could not check whether '{indexer_name}' is running: {str(e)}")
+            running = False
+        if running:
+            return False
+        await self._run_with_retry_async(client, indexer_name)
+        return True
+    
+    def _run_with_retry(self, indexer_name: str):
+        """Start an indexer, retrying throttled requests and waiting out a run already in progress"""
+        from azure.core.exceptions import HttpResponseError, ResourceExistsError
+        
+        for attempt in range(_RUN_MAX_ATTEMPTS):
+            try:
+                return self.indexer_client.run_indexer(indexer_name, retry_status=0)
+            except HttpResponseError as e:
+                if not _should_retry(e, attempt):
+                    raise
+                if isinstance(e, ResourceExistsError):
+                    logger.warning(f"Indexer '{indexer_name}' is already running, waiting for it to finish")
+                    for _ in range(_IN_PROGRESS_MAX_POLLS):
+                        if not _in_progress(self.indexer_client.get_indexer_status(indexer_name)):
+                            break
+                        time.sleep(_IN_PROGRESS_POLL_INTERVAL)
+                else:
+                    delay = _retry_delay(e, attempt)
+                    logger.warning(f"Indexer '{indexer_name}' throttled ({e.status_code}), retrying in {delay:.1f}s")
+                    time.sleep(delay)
+    
+    async def _run_with_retry_async(self, client, indexer_name: str):
+        """Async counterpart of _run_with_retry on an aio indexer client"""
+        from azure.core.exceptions import HttpResponseError, ResourceExistsError
+        
+        for attempt in range(_RUN_MAX_ATTEMPTS):
+            try:
+                return await client.run_indexer(indexer_name, retry_status=0)
+            except HttpResponseError as e:
+                if not _should_retry(e, attempt):
+                    raise
+                if isinstance(e, ResourceExistsError):
+                    logger.warning(f"Indexer '{indexer_name}' is already running, waiting for it to finish")
+                    for _ in range(_IN_PROGRESS_MAX_POLLS):
+                        if not _in_progress(await client.get_indexer_status(indexer_name)):
+                            break
+                        await asyncio.sleep(_IN_PROGRESS_POLL_INTERVAL)
+                else:
+                    delay = _retry_delay(e, attempt)
+                    logger.warning(f"Indexer '{indexer_name}' throttled ({e.status_code}), retrying in {delay:.1f}s")
+                    await asyncio.sleep(delay)
+    
+    @asynccontextmanager
+    async def _async_indexer_client(self):
+        """Open an async indexer client, its credential and HTTP session for the duration of a batch"""
+        import aiohttp
+        from azure.core.credentials import AzureKeyCredential
+        from azure.core.pipeline.transport import AioHttpTransport
+        from azure.search.documents.indexes.aio import SearchIndexerClient as AsyncSearchIndexerClient
+        
+        async with AsyncExitStack() as stack:
+            if self.search_key:
+                credential = AzureKeyCredential(self.search_key)
+            else:
+                # Same providers skipped as for the shared sync credential
+                from _client_cache import create_async_default_credential
+                
+                credential = await stack.enter_async_context(create_async_default_credential())
+            
+            # Every request in the batch shares one pool of keep-alive connections;
+            # session options match the ones AioHttpTransport uses for its own sessions
+            session = await stack.enter_async_context(aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=_ASYNC_POOL_SIZE, keepalive_timeout=60),
+                trust_env=True,
+                cookie_jar=aiohttp.DummyCookieJar(),
+                auto_decompress=False
+            ))
+            client = await stack.enter_async_context(AsyncSearchIndexerClient(
+                self.search_endpoint,
+                credential,
+                transport=AioHttpTransport(session=session, session_owner=False)
+            ))
+            yield client
+    
+    def _selected_indexers(self, indexer_type: str):
+        """List (state_code, kind, indexer_name) for the selected indexers of every state"""
+        return [
+            (state_code, kind, getattr(config.indexers, kind))
+            for state_code, config in STATES.items()
+            for kind in ('state', 'common')
+            if indexer_type in (kind, 'both')
+        ]
+    
+    async def _gather_indexers(self, operation, indexer_type: str):
+        """
+        Await operation(client, indexer_name) for every selected indexer concurrently
+        
+        Returns a list of ((state_code, kind, indexer_name), result_or_exception)
+        """
+        selected = self._selected_indexers(indexer_type)
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+        
+        async with self._async_indexer_client() as client:
+            async def call_one(indexer_name):
+                async with semaphore:
+                    return await operation(client, indexer_name)
+            
+            outcomes = await asyncio.gather(
+                *[call_one(indexer_name) for _, _, indexer_name in selected],
+                return_exceptions=True
+            )
+        return list(zip(selected, outcomes))
+    
     def run_indexer(self, state_code: str, indexer_type: str = 'both'):
         """
         Run indexer(s) for a specific state
@@ -102,41 +286,36 @@ class AzureIndexerRunner:
             indexer_type: Type of indexer to run ('state', 'common', or 'both')
         """
         try:
-            if state_code not in self.states:
+            state_code = _normalize_state_code(state_code)
+            if state_code not in STATE_CODES:
                 logger.error(f"Invalid state code: {state_code}")
                 return False
             
-            state_name = self.states[state_code]['name']
-            indexers = self.states[state_code]['indexers']
-            
-            results = {}
+            state_name = STATES[state_code].name
+            indexers = STATES[state_code].indexers
             
+            selected = []
             if indexer_type in ['state', 'both']:
-                indexer_name = indexers['state']
-                logger.info(f"Running state indexer for {state_name} ({state_code.upper()}): {indexer_name}")
-                try:
-                    self.indexer_client.run_indexer(indexer_name)
-                    logger.info(f"✓ Indexer '{indexer_name}' started successfully")
-                    results['state'] = True
-                except Exception as e:
-                    logger.error(f"✗ Failed to run state indexer: {str(e)}")
-                    results['state'] = False
-            
+                selected.append(('state', indexers.state))
             if indexer_type in ['common', 'both']:
-                if indexer_type == 'both':
-                    time.sleep(1)  # Small delay between indexers
-                
-                indexer_name = indexers['common']
-                logger.info(f"Running common indexer for {state_name} ({state_code.upper()}): {indexer_name}")
+                selected.append(('common', indexers.common))
+            
+            def submit(kind, indexer_name):
+                logger.info(f"Running {kind} indexer for {state_name} ({state_code.upper()}): {indexer_name}")
                 try:
-                    self.indexer_client.run_indexer(indexer_name)
-                    logger.info(f"✓ Indexer '{indexer_name}' started successfully")
-                    results['common'] = True
+                    self._start_indexer(indexer_name)
+                    return True
                 except Exception as e:
-                    logger.error(f"✗ Failed to run common indexer: {str(e)}")
-                    results['common'] = False
+                    logger.error(f"✗ Failed to run {kind} indexer: {str(e)}")
+                    return False
             
-            return all(results.values()) if results else False
+            # Submissions only schedule a run, so both go out at once; throttling
+            # is handled by the retry in _start_indexer
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [executor.submit(submit, kind, indexer_name) for kind, indexer_name in selected]
+            results = [future.result() for future in futures]
+            
+            return all(results) if results else False
             
         except Exception as e:
             logger.error(f"Failed to run indexer for state '{state_code}': {str(e)}")
@@ -151,21 +330,22 @@ class AzureIndexerRunner:
             indexer_type: Type of indexer to check ('state', 'common', or 'both')
         """
         try:
-            if state_code not in self.states:
+            state_code = _normalize_state_code(state_code)
+            if state_code not in STATE_CODES:
                 logger.error(f"Invalid state code: {state_code}")
                 return None
             
-            indexers = self.states[state_code]['indexers']
+            indexers = STATES[state_code].indexers
             statuses = {}
             
             if indexer_type in ['state', 'both']:
-                indexer_name = indexers['state']
+                indexer_name = indexers.state
                 status = self.indexer_client.get_indexer_status(indexer_name)
                 statuses['state'] = status
                 self._print_indexer_status(indexer_name, status, "State-Specific")
             
             if indexer_type in ['common', 'both']:
-                indexer_name = indexers['common']
+                indexer_name = indexers.common
                 status = self.indexer_client.get_indexer_status(indexer_name)
                 statuses['common'] = status
                 self._print_indexer_status(indexer_name, status, "Common")
@@ -178,29 +358,33 @@ class AzureIndexerRunner:
     
     def _print_indexer_status(self, indexer_name: str, status, indexer_label: str):
         """Helper method to print indexer status"""
-        print(f"\n{'='*60}")
-        print(f"Indexer Status: {indexer_name} ({indexer_label})")
-        print(f"{'='*60}")
-        print(f"Status: {status.status}")
-        print(f"Last Result: {status.last_result.status if status.last_result else 'N/A'}")
-        
-        if status.last_result:
-            print(f"Items Processed: {status.last_result.items_processed}")
-            print(f"Items Failed: {status.last_result.items_failed}")
-            print(f"Start Time: {status.last_result.start_time}")
-            print(f"End Time: {status.last_result.end_time}")
+        # Built up and written in one go rather than a print() per line
+        last_result = status.last_result
+        lines = [
+            "",
+            "="*60,
+            f"Indexer Status: {indexer_name} ({indexer_label})",
+            "="*60,
+            f"Status: {status.status}",
+            f"Last Result: {last_result.status if last_result else 'N/A'}",
+        ]
+        
+        if last_result:
+            lines.append(f"Items Processed: {last_result.items_processed}")
+            lines.append(f"Items Failed: {last_result.items_failed}")
+            lines.append(f"Start Time: {last_result.start_time}")
+            lines.append(f"End Time: {last_result.end_time}")
             
-            if status.last_result.errors:
-                print(f"\nErrors ({len(status.last_result.errors)}):")
-                for error in status.last_result.errors[:5]:  # Show first 5 errors
-                    print(f"  - {error.error_message}")
+            if last_result.errors:
+                lines.extend(["", f"Errors ({len(last_result.errors)}):"])
+                lines.extend(f"  - {error.error_message}" for error in last_result.errors[:5])  # Show first 5 errors
             
-            if status.last_result.warnings:
-                print(f"\nWarnings ({len(status.last_result.warnings)}):")
-                for warning in status.last_result.warnings[:5]:  # Show first 5 warnings
-                    print(f"  - {warning.message}")
+            if last_result.warnings:
+                lines.extend(["", f"Warnings ({len(last_result.warnings)}):"])
+                lines.extend(f"  - {warning.message}" for warning in last_result.warnings[:5])  # Show first 5 warnings
         
-        print("="*60 + "\n")
+        lines.extend(["="*60, ""])
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def reset_indexer(self, state_code: str, indexer_type: str = 'both'):
         """
@@ -211,15 +395,16 @@ class AzureIndexerRunner:
             indexer_type: Type of indexer to reset ('state', 'common', or 'both')
         """
         try:
-            if state_code not in self.states:
+            state_code = _normalize_state_code(state_code)
+            if state_code not in STATE_CODES:
                 logger.error(f"Invalid state code: {state_code}")
                 return False
             
-            indexers = self.states[state_code]['indexers']
+            indexers = STATES[state_code].indexers
             results = {}
             
             if indexer_type in ['state', 'both']:
-                indexer_name = indexers['state']
+                indexer_name = indexers.state
                 logger.info(f"Resetting state indexer: {indexer_name}")
                 try:
                     self.indexer_client.reset_indexer(indexer_name)
@@ -230,7 +415,7 @@ class AzureIndexerRunner:
                     results['state'] = False
             
             if indexer_type in ['common', 'both']:
-                indexer_name = indexers['common']
+                indexer_name = indexers.common
                 logger.info(f"Resetting common indexer: {indexer_name}")
                 try:
                     self.indexer_client.reset_indexer(indexer_name)
@@ -258,10 +443,9 @@ class AzureIndexerRunner:
         logger.info("="*60 + "\n")
         
         results = {}
-        for state_code in self.states.keys():
+        for state_code in STATES:
             success = self.run_indexer(state_code, indexer_type)
             results[state_code] = success
-            time.sleep(2)  # Small delay between starting indexers
         
         # Summary
         logger.info("\n" + "="*60)
@@ -269,11 +453,90 @@ class AzureIndexerRunner:
         logger.info("="*60)
         
         for state_code, success in results.items():
-            state_name = self.states[state_code]['name']
+            state_name = STATES[state_code].name
+            status = "✓ Success" if success else "✗ Failed"
+            logger.info(f"{state_name} ({state_code.upper()}): {status}")
+        
+        logger.info("="*60 + "\n")
+    
+    async def run_all_indexers_async(self, indexer_type: str = 'both'):
+        """
+        Run all indexers for all states concurrently
+        
+        Args:
+            indexer_type: Type of indexer to run ('state', 'common', or 'both')
+        
+        Returns:
+            dict mapping state code to True if all of its indexers started
+        """
+        logger.info("\n" + "="*60)
+        logger.info(f"Running all indexers (type: {indexer_type})")
+        logger.info("="*60 + "\n")
+        
+        results = {}
+        for (state_code, kind, indexer_name), outcome in await self._gather_indexers(self._start_indexer_async, indexer_type):
+            if isinstance(outcome, Exception):
+                logger.error(f"✗ Failed to run {kind} indexer '{indexer_name}': {str(outcome)}")
+            elif outcome:
+                logger.info(f"✓ Indexer '{indexer_name}' started successfully")
+            else:
+                logger.info(f"✓ Indexer '{indexer_name}' is already running, skipping")
+            results[state_code] = results.get(state_code, True) and not isinstance(outcome, Exception)
+        
+        # Summary
+        logger.info("\n" + "="*60)
+        logger.info("Indexer Run Summary")
+        logger.info("="*60)
+        
+        for state_code, success in results.items():
+            state_name = STATES[state_code].name
             status = "✓ Success" if success else "✗ Failed"
             logger.info(f"{state_name} ({state_code.upper()}): {status}")
         
         logger.info("="*60 + "\n")
+        return results
+    
+    async def get_all_indexer_status_async(self, indexer_type: str = 'both'):
+        """
+        Get the status of all indexers for all states concurrently
+        
+        Args:
+            indexer_type: Type of indexer to check ('state', 'common', or 'both')
+        
+        Returns:
+            dict mapping state code to {kind: status}; failed lookups are omitted
+        """
+        outcomes = await self._gather_indexers(lambda client, name: client.get_indexer_status(name), indexer_type)
+        
+        statuses = {}
+        for (state_code, kind, indexer_name), outcome in outcomes:
+            if isinstance(outcome, Exception):
+                logger.error(f"Failed to get indexer status for '{indexer_name}': {str(outcome)}")
+                continue
+            statuses.setdefault(state_code, {})[kind] = outcome
+            self._print_indexer_status(indexer_name, outcome, "State-Specific" if kind == 'state' else "Common")
+        return statuses
+    
+    async def reset_all_indexers_async(self, indexer_type: str = 'both'):
+        """
+        Reset all indexers for all states concurrently
+        
+        Args:
+            indexer_type: Type of indexer to reset ('state', 'common', or 'both')
+        
+        Returns:
+            dict mapping state code to True if all of its indexers were reset
+        """
+        outcomes = await self._gather_indexers(lambda client, name: client.reset_indexer(name), indexer_type)
+        
+        results = {}
+        for (state_code, kind, indexer_name), outcome in outcomes:
+            if isinstance(outcome, Exception):
+                logger.error(f"✗ Failed to reset {kind} indexer '{indexer_name}': {str(outcome)}")
+            else:
+                logger.info(f"✓ Indexer '{indexer_name}' reset successfully")
+            results[state_code] = results.get(state_code, True) and not isinstance(outcome, Exception)
+        return results
     
     def monitor_indexer(self, state_code: str, indexer_type: str = 'both', 
                        check_interval: int = 10, max_checks: int = 30):
@@ -286,59 +549,94 @@ class AzureIndexerRunner:
             check_interval: Seconds between status checks
             max_checks: Maximum number of status checks
         """
+        asyncio.run(self.monitor_indexer_async(state_code, indexer_type, check_interval, max_checks))
+    
+    async def monitor_indexer_async(self, state_code: str, indexer_type: str = 'both',
+                                    check_interval: int = 10, max_checks: int = 30,
+                                    max_interval: int = 60):
+        """
+        Monitor indexer(s) progress, checking all unfinished indexers concurrently
+        
+        An indexer stops being polled once its last run reaches a terminal status,
+        and the wait between checks doubles (up to max_interval) while nothing changes
+        
+        Args:
+            state_code: State code to monitor
+            indexer_type: Type of indexer to monitor ('state', 'common', or 'both')
+            check_interval: Initial seconds between status checks
+            max_checks: Maximum number of status checks
+            max_interval: Longest wait between status checks
+        """
         try:
-            if state_code not in self.states:
+            state_code = _normalize_state_code(state_code)
+            if state_code not in STATE_CODES:
                 logger.error(f"Invalid state code: {state_code}")
                 return
             
-            state_name = self.states[state_code]['name']
-            indexers = self.states[state_code]['indexers']
+            state_name = STATES[state_code].name
+            indexers = STATES[state_code].indexers
             
             logger.info(f"Monitoring indexer(s) for {state_name} ({state_code.upper()})")
-            logger.info(f"Checking every {check_interval} seconds (max {max_checks} checks)\n")
+            logger.info(f"Checking every {check_interval}-{max(check_interval, max_interval)} seconds (max {max_checks} checks)\n")
             
-            indexers_to_monitor = []
+            pending = {}
             if indexer_type in ['state', 'both']:
-                indexers_to_monitor.append(('State', indexers['state']))
+                pending['State'] = indexers.state
             if indexer_type in ['common', 'both']:
-                indexers_to_monitor.append(('Common', indexers['common']))
+                pending['Common'] = indexers.common
+            monitored = dict(pending)
             
-            for i in range(max_checks):
-                timestamp = datetime.now().strftime("%H:%M:%S")
-                print(f"\n[{timestamp}] Check #{i+1}/{max_checks}")
-                print("-" * 60)
-                
-                all_completed = True
-                
-                for label, indexer_name in indexers_to_monitor:
-                    status = self.indexer_client.get_indexer_status(indexer_name)
-                    current_status = status.status
-                    last_result = status.last_result
+            latest = {}
+            previous_progress = None
+            interval = check_interval
+            
+            async with self._async_indexer_client() as client:
+                for i in range(max_checks):
+                    timestamp = datetime.now().strftime("%H:%M:%S")
+                    lines = ["", f"[{timestamp}] Check #{i+1}/{max_checks}", "-" * 60]
+                    
+                    labels = list(pending)
+                    statuses = await asyncio.gather(*[client.get_indexer_status(pending[label]) for label in labels])
                     
-                    if last_result:
-                        print(f"{label:12} | Status: {current_status:10} | "
-                              f"Last: {last_result.status:15} | "
-                              f"Processed: {last_result.items_processed:4} | "
-                              f"Failed: {last_result.items_failed:4}")
+                    progress = {}
+                    for label, status in zip(labels, statuses):
+                        latest[label] = status
+                        current_status = status.status
+                        last_result = status.last_result
                         
-                        if last_result.status not in ['success', 'transientFailure', 'persistentFailure']:
-                            all_completed = False
-                    else:
-                        print(f"{label:12} | Status: {current_status:10} | No execution history yet")
-                        all_completed = False
-                
-                if all_completed:
-                    logger.info(f"\nAll monitored indexers completed")
-                    break
-                
-                if i < max_checks - 1:
-                    time.sleep(check_interval)
+                        if last_result:
+                            lines.append(f"{label:12} | Status: {current_status:10} | "
+                                         f"Last: {last_result.status:15} | "
+                                         f"Processed: {last_result.items_processed:4} | "
+                                         f"Failed: {last_result.items_failed:4}")
+                            
+                            if last_result.status in _TERMINAL_STATUSES:
+                                del pending[label]
+                            progress[label] = (last_result.status, last_result.items_processed)
+                        else:
+                            lines.append(f"{label:12} | Status: {current_status:10} | No execution history yet")
+                            progress[label] = None
+                    sys.stdout.write("\n".join(lines) + "\n")
+                    
+                    if not pending:
+                        logger.info(f"\nAll monitored indexers completed")
+                        break
+                    
+                    if i < max_checks - 1:
+                        # Back off while nothing moves; check again promptly after a change
+                        if progress == previous_progress:
+                            interval = min(interval * 2, max(check_interval, max_interval))
+                        else:
+                            interval = check_interval
+                        previous_progress = progress
+                        await asyncio.sleep(interval)
             
-            # Final status
-            print("\n" + "="*60)
-            print("Final Status Report")
-            print("="*60)
-            self.get_indexer_status(state_code, indexer_type)
+            # Final status, from the last check of each indexer
+            sys.stdout.write("\n" + "="*60 + "\nFinal Status Report\n" + "="*60 + "\n")
+            for label, indexer_name in monitored.items():
+                if label in latest:
+                    self._print_indexer_status(indexer_name, latest[label],
+                                               "State-Specific" if label == 'State' else "Common")
             
         except Exception as e:
             logger.error(f"Failed to monitor indexer: {str(e)}")
@@ -357,8 +655,8 @@ def main():
         print("🚀 Starting all indexers (both state-specific and common)...")
         print("This will start 12 indexers across 6 states (IA, IN, OH, TX, VA, WA)\n")
         
-        # Run all indexers
-        runner.run_all_indexers('both')
+        # Run all indexers concurrently
+        asyncio.run(runner.run_all_indexers_async('both'))
         
         print("\n✓ All indexers have been started successfully!")
         print("Check Azure Portal to monitor their progress.")
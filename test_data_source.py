@@ -1,6 +1,5 @@
-from azure.search.documents.indexes import SearchIndexerClient
-from azure.search.documents.indexes.models import SearchIndexerDataSourceConnection
-from azure.identity import DefaultAzureCredential
+import asyncio
+from run_indexer import STATES
 
 class AzureSearchDataSourceManager:
     def __init__(self):
@@ -16,11 +15,35 @@ class AzureSearchDataSourceManager:
         self.storage_resource_id = f"/subscriptions/{self.subscription_id}/resourceGroups/{self.resource_group}/providers/Microsoft.Storage/storageAccounts/{self.storage_account_name}"
         self.managed_identity_resource_id = f"/subscriptions/{self.subscription_id}/resourcegroups/{self.resource_group}/providers/Microsoft.ManagedIdentity/userAssignedIdentities/guruMA"
         
-        # Initialize the client with DefaultAzureCredential
-        credential = DefaultAzureCredential()
-        self.indexer_client = SearchIndexerClient(
-            endpoint=self.search_endpoint,
-            credential=credential
+        # Shared client with DefaultAzureCredential, reused across manager instances
+        # (imported here so the Azure SDK loads only when a manager is created)
+        from _client_cache import get_indexer_client
+        
+        self.indexer_client = get_indexer_client(self.search_endpoint)
+    
+    def _build_data_source(self, datasource_name, container_name):
+        """
+        Builds a blob data source definition that authenticates with the user-assigned managed identity
+        
+        Args:
+            datasource_name: Name for the data source
+            container_name: Blob container the data source reads
+        
+        Returns:
+            SearchIndexerDataSourceConnection: The data source definition
+        """
+        from azure.search.documents.indexes.models import SearchIndexerDataSourceConnection
+        
+        # Build connection string with managed identity
+        # Format: ResourceId={storage_resource_id};Identity=[system|{managed_identity_resource_id}]
+        connection_string = f"ResourceId={self.storage_resource_id};Identity={self.managed_identity_resource_id};"
+        
+        # The identity is specified in the connection string itself
+        return SearchIndexerDataSourceConnection(
+            name=datasource_name,
+            type="azureblob",
+            connection_string=connection_string,
+            container={"name": container_name}
         )
     
     def create_data_source(self, datasource_name="guru-medicaid-datasource"):
@@ -34,18 +57,8 @@ class AzureSearchDataSourceManager:
             SearchIndexerDataSourceConnection: The created data source
         """
         try:
-            # Build connection string with managed identity
-            # Format: ResourceId={storage_resource_id};Identity=[system|{managed_identity_resource_id}]
-            connection_string = f"ResourceId={self.storage_resource_id};Identity={self.managed_identity_resource_id};"
-            
             # Create the data source connection without identity parameter
-            # The identity is specified in the connection string itself
-            data_source = SearchIndexerDataSourceConnection(
-                name=datasource_name,
-                type="azureblob",
-                connection_string=connection_string,
-                container={"name": self.container_name}
-            )
+            data_source = self._build_data_source(datasource_name, self.container_name)
             
             # Create or update the data source
             result = self.indexer_client.create_or_update_data_source_connection(data_source)
@@ -64,6 +77,41 @@ class AzureSearchDataSourceManager:
             traceback.print_exc()
             raise
     
+    async def create_all_data_sources(self):
+        """
+        Creates the state and common container data sources for every state concurrently
+        
+        Returns:
+            dict: Data source name -> created SearchIndexerDataSourceConnection, or the exception it raised
+        """
+        from azure.search.documents.indexes.aio import SearchIndexerClient as AsyncSearchIndexerClient
+        from _client_cache import create_async_default_credential
+        
+        targets = [
+            (f"guru-medicaid-{state_code}-{kind}-datasource",
+             f"guru-medicaid-{state_code}-sit" if kind == 'state' else "guru-medicaid-common-sit")
+            for state_code in STATES
+            for kind in ('state', 'common')
+        ]
+        
+        # One credential and client shared by every request in the batch; the
+        # credential skips the same providers as the shared sync one
+        async with create_async_default_credential() as credential:
+            async with AsyncSearchIndexerClient(self.search_endpoint, credential) as client:
+                outcomes = await asyncio.gather(
+                    *[client.create_or_update_data_source_connection(self._build_data_source(name, container))
+                      for name, container in targets],
+                    return_exceptions=True
+                )
+        
+        for (name, container), outcome in zip(targets, outcomes):
+            if isinstance(outcome, Exception):
+                print(f"❌ Error creating data source '{name}': {str(outcome)}")
+            else:
+                print(f"✅ Data source '{name}' created successfully! (Container: {container})")
+        
+        return {name: outcome for (name, _), outcome in zip(targets, outcomes)}
+    
     def verify_data_source(self, datasource_name="guru-medicaid-datasource"):
         """
         Verifies that the data source exists and displays its configuration
@@ -1,270 +1,495 @@
 from dotenv import load_dotenv
-from azure.identity import DefaultAzureCredential
-from azure.storage.blob import BlobServiceClient
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
-from io import BytesIO
+from azure.core.exceptions import ResourceNotFoundError
+from azure.core.pipeline.transport import AioHttpTransport
+from azure.identity.aio import DefaultAzureCredential
+from azure.storage.blob import ContentSettings
+from azure.storage.blob.aio import BlobServiceClient, ContainerClient
+from tempfile import SpooledTemporaryFile
+from typing import IO, ClassVar, Optional
+import aiohttp
+import asyncio
+import atexit
+import functools
+import hashlib
+import logging.handlers
 import os
+import queue
+import sys
+
+# Load environment variables once, before the settings below read them
+load_dotenv()
+
+# Progress output goes through a queue to a background thread that writes it to
+# stdout, so concurrent uploads never wait on the terminal
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_log_queue = queue.SimpleQueue()
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_handler = logging.StreamHandler(sys.stdout)
+_log_handler.setFormatter(logging.Formatter("%(message)s"))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+# Stopping the listener writes out any records still queued
+atexit.register(_log_listener.stop)
+
+# Rules framing the run's section and per-state banners
+_RULE = "=" * 70
+_STATE_RULE = "=" * 60
+
+_STORAGE_SCOPE = "https://storage.azure.com/.default"
+
+# Most deletes the Blob batch API accepts in one request
+_DELETE_BATCH_SIZE = 256
+
+# Most blobs a single List Blobs response can return
+_LIST_PAGE_SIZE = 5000
+
+# Connections the shared blob client may open; concurrent state uploads and
+# chunked uploads each need their own socket
+_CONNECTION_POOL_SIZE = 100
+
+# Generated PDFs stay in memory up to this size, then spill to a temporary file
+_PDF_SPOOL_SIZE = 256 * 1024
+
+# Generated PDFs waiting for upload, per state, before generation pauses
+_PDF_QUEUE_SIZE = 3
+
+# Concurrent uploads per state
+_UPLOAD_WORKERS = 3
+
+# (state name, container name) for each of the six test states
+_STATE_CONTAINERS = tuple(
+    (os.environ.get(f"STATE{i}_NAME", f"State{i}"),
+     os.environ.get(f"AZURE_BLOB_CONTAINER_STATE{i}", f"state{i}-container"))
+    for i in range(1, 7)
+)
+
+
+def _pdf_show(text: str) -> bytes:
+    """Text-showing operator for one line of text"""
+    escaped = text.encode("cp1252", "replace").replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+    return b"(%s) Tj" % escaped
+
+
+def _pdf_text(font: bytes, size: int, x: int, y: int, text: str) -> bytes:
+    """Content stream operators drawing one line of text at (x, y)"""
+    return b"BT /%s %d Tf %d %d Td %s ET\n" % (font, size, x, y, _pdf_show(text))
+
+
+@functools.lru_cache(maxsize=64)
+def _boilerplate_lines(num_pages: int) -> tuple:
+    """(index, operator) for the body lines shared by every page of every num_pages-page document"""
+    return (
+        (3, _pdf_show("Sample content for testing Azure Cognitive Search indexing.")),
+        (4, _pdf_show(f"This document contains {num_pages} pages in total.")),
+        (8, _pdf_show("Lorem ipsum dolor sit amet, consectetur adipiscing elit.")),
+        (9, _pdf_show("Sed do eiusmod tempor incididunt ut labore et dolore magna aliqua.")),
+        (10, _pdf_show("Ut enim ad minim veniam, quis nostrud exercitation ullamco.")),
+        (15, _pdf_show("- Status: Active")),
+    )
+
+
+def _pdf_prefix() -> tuple:
+    """Header and font objects every test PDF starts with, and the fonts' offsets"""
+    prefix = b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n"
+    offsets = {}
+    for obj_id, base_font in ((3, b"Helvetica"), (4, b"Helvetica-Bold")):
+        offsets[obj_id] = len(prefix)
+        prefix += (b"%d 0 obj\n<< /Type /Font /Subtype /Type1 /BaseFont /%s /Encoding /WinAnsiEncoding >>\nendobj\n"
+                   % (obj_id, base_font))
+    return prefix, offsets
+
+
+class _MinimalPdf:
+    """
+    Minimal PDF writer for the text-only test documents
+    Writes Letter-size pages using the standard Helvetica fonts (/F1 regular,
+    /F2 bold) to a binary stream, tracking each object's offset for the xref
+    table; output is collected in a bytearray and flushed after every page
+    """
+    
+    _CATALOG, _PAGES, _FONT_REGULAR, _FONT_BOLD = 1, 2, 3, 4
+    # Header and one font object of each kind, shared by every page; built once
+    _PREFIX, _PREFIX_OFFSETS = _pdf_prefix()
+    
+    def __init__(self, stream: IO[bytes]):
+        self._stream = stream
+        self._flushed = 0
+        self._buffer = bytearray(self._PREFIX)
+        self._offsets = dict(self._PREFIX_OFFSETS)
+        self._page_ids = []
+        self._next_id = 5
+    
+    def write(self, data: bytes):
+        self._buffer += data
+    
+    def _tell(self) -> int:
+        return self._flushed + len(self._buffer)
+    
+    def _flush(self):
+        self._stream.write(self._buffer)
+        self._flushed += len(self._buffer)
+        self._buffer.clear()
+    
+    def _write_object(self, obj_id: int, body: bytes):
+        self._offsets[obj_id] = self._tell()
+        self.write(b"%d 0 obj\n%s\nendobj\n" % (obj_id, body))
+    
+    def add_page(self, content: bytes):
+        """Add a page drawn by the given content stream"""
+        content_id, page_id = self._next_id, self._next_id + 1
+        self._next_id += 2
+        self._write_object(content_id, b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content))
+        self._write_object(page_id, b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 612 792] "
+                                    b"/Resources << /Font << /F1 %d 0 R /F2 %d 0 R >> >> /Contents %d 0 R >>"
+                                    % (self._PAGES, self._FONT_REGULAR, self._FONT_BOLD, content_id))
+        self._page_ids.append(page_id)
+        self._flush()
+    
+    def output(self):
+        """Finish the document with the page tree, catalog, xref table and trailer"""
+        kids = b" ".join(b"%d 0 R" % page_id for page_id in self._page_ids)
+        self._write_object(self._PAGES, b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(self._page_ids)))
+        self._write_object(self._CATALOG, b"<< /Type /Catalog /Pages %d 0 R >>" % self._PAGES)
+        
+        xref_offset = self._tell()
+        self.write(b"xref\n0 %d\n0000000000 65535 f \n" % self._next_id)
+        self.write(b"".join(b"%010d 00000 n \n" % self._offsets[obj_id] for obj_id in range(1, self._next_id)))
+        self.write(b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+                   % (self._next_id, self._CATALOG, xref_offset))
+        self._flush()
+
 
 class BlobTestDataUploader:
+    # Credential and client shared by every uploader in the process, so the
+    # credential chain is resolved and its token cached only once
+    _shared_credential: ClassVar[Optional[DefaultAzureCredential]] = None
+    _shared_client: ClassVar[Optional[BlobServiceClient]] = None
+    _shared_session: ClassVar[Optional[aiohttp.ClientSession]] = None
+    # Containers known to exist, so each is checked at most once per process
+    _verified_containers: ClassVar[set] = set()
+    
     def __init__(self):
-        # Load environment variables
-        load_dotenv()
-        
-        # Use Managed Identity
-        self.credential = DefaultAzureCredential()
+        """Create the uploader; must run inside the event loop, where the shared HTTP session is opened"""
         self.storage_account_name = os.environ["AZURE_STORAGE_ACCOUNT_NAME"]
         self.account_url = f"https://{self.storage_account_name}.blob.core.windows.net"
         
-        # Initialize Blob Service Client with Managed Identity
-        self.blob_service_client = BlobServiceClient(
-            account_url=self.account_url,
-            credential=self.credential
-        )
-        
-        # Container names
-        self.containers = [
-            os.environ.get("AZURE_BLOB_CONTAINER_STATE1", "state1-container"),
-            os.environ.get("AZURE_BLOB_CONTAINER_STATE2", "state2-container"),
-            os.environ.get("AZURE_BLOB_CONTAINER_STATE3", "state3-container"),
-            os.environ.get("AZURE_BLOB_CONTAINER_STATE4", "state4-container"),
-            os.environ.get("AZURE_BLOB_CONTAINER_STATE5", "state5-container"),
-            os.environ.get("AZURE_BLOB_CONTAINER_STATE6", "state6-container")
-        ]
+        if BlobTestDataUploader._shared_client is None:
+            # Use Managed Identity
+            BlobTestDataUploader._shared_credential = DefaultAzureCredential()
+            
+            # HTTP session with the larger connection pool; other options match
+            # the sessions AioHttpTransport creates for itself
+            BlobTestDataUploader._shared_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=_CONNECTION_POOL_SIZE),
+                trust_env=True,
+                cookie_jar=aiohttp.DummyCookieJar(),
+                auto_decompress=False
+            )
+            
+            # Initialize Blob Service Client with Managed Identity; one client (and
+            # connection pool) serves the whole run, closed by close()
+            # PDFs over 4 MiB upload as 4 MiB blocks in parallel rather than one PUT
+            BlobTestDataUploader._shared_client = BlobServiceClient(
+                account_url=self.account_url,
+                credential=BlobTestDataUploader._shared_credential,
+                max_single_put_size=4 * 1024 * 1024,
+                max_block_size=4 * 1024 * 1024,
+                transport=AioHttpTransport(session=BlobTestDataUploader._shared_session, session_owner=False)
+            )
+        self.credential = BlobTestDataUploader._shared_credential
+        self.blob_service_client = BlobTestDataUploader._shared_client
+        self.http_session = BlobTestDataUploader._shared_session
         
-        # State names
-        self.state_names = [
-            os.environ.get("STATE1_NAME", "State1"),
-            os.environ.get("STATE2_NAME", "State2"),
-            os.environ.get("STATE3_NAME", "State3"),
-            os.environ.get("STATE4_NAME", "State4"),
-            os.environ.get("STATE5_NAME", "State5"),
-            os.environ.get("STATE6_NAME", "State6")
-        ]
+        self.state_container_pairs: tuple[tuple[str, str], ...] = _STATE_CONTAINERS
+    
+    async def close(self):
+        """Close the shared blob service client, credential and HTTP session; later uploaders create new ones"""
+        if BlobTestDataUploader._shared_client is self.blob_service_client:
+            BlobTestDataUploader._shared_client = None
+            BlobTestDataUploader._shared_credential = None
+            BlobTestDataUploader._shared_session = None
+        await self.blob_service_client.close()
+        await self.credential.close()
+        await self.http_session.close()
+    
+    async def prime_token(self):
+        """Fetch a storage token up front so concurrent uploads don't all wait on the first one"""
+        try:
+            await self.credential.get_token(_STORAGE_SCOPE)
+        except Exception as e:
+            logger.warning("⚠️  Could not get a storage token ahead of the uploads: %s", e)
     
-    def create_dummy_pdf(self, title: str, num_pages: int = 3, content_prefix: str = "") -> BytesIO:
-        """Create a dummy PDF with specified number of pages"""
-        buffer = BytesIO()
-        pdf = canvas.Canvas(buffer, pagesize=letter)
+    def create_dummy_pdf(self, title: str, num_pages: int = 3, content_prefix: str = "") -> IO[bytes]:
+        """Create a dummy PDF with specified number of pages
+        
+        Returns a spooled temporary file positioned at the start; PDFs larger
+        than 256 KiB are kept on disk rather than in memory. The caller closes it.
+        """
+        buffer = SpooledTemporaryFile(max_size=_PDF_SPOOL_SIZE, mode='w+b')
+        pdf = _MinimalPdf(buffer)
+        
+        # Title and the body lines that are the same on every page are encoded
+        # once; lines shared by all documents of this length come from the cache.
+        # The body is one text object with 15pt leading from y=680, each line
+        # moving down with T*; blank lines only move down
+        title_ops = _pdf_text(b"F2", 16, 100, 750, title)
+        body = [b""] * 16
+        for index, line_ops in _boilerplate_lines(num_pages):
+            body[index] = line_ops
+        body[1] = _pdf_show(f"Document: {title}")
+        keywords = content_prefix.lower()
+        content_id = title.replace(' ', '_')
         
         for page_num in range(1, num_pages + 1):
-            # Add title
-            pdf.setFont("Helvetica-Bold", 16)
-            pdf.drawString(100, 750, title)
-            
-            # Add page number
-            pdf.setFont("Helvetica", 12)
-            pdf.drawString(100, 720, f"Page {page_num} of {num_pages}")
-            
-            # Add some content
-            pdf.setFont("Helvetica", 10)
-            y_position = 680
-            
-            content_lines = [
-                f"{content_prefix} - This is page {page_num}",
-                f"Document: {title}",
-                f"",
-                f"Sample content for testing Azure Cognitive Search indexing.",
-                f"This document contains {num_pages} pages in total.",
-                f"",
-                f"Keywords: test, document, page{page_num}, {content_prefix.lower()}",
-                f"",
-                f"Lorem ipsum dolor sit amet, consectetur adipiscing elit.",
-                f"Sed do eiusmod tempor incididunt ut labore et dolore magna aliqua.",
-                f"Ut enim ad minim veniam, quis nostrud exercitation ullamco.",
-                f"",
-                f"Page {page_num} specific information:",
-                f"- Section: {chr(64 + page_num)}",
-                f"- Content ID: {title.replace(' ', '_')}_p{page_num}",
-                f"- Status: Active"
-            ]
+            # Only the page-specific lines are rebuilt
+            body[0] = _pdf_show(f"{content_prefix} - This is page {page_num}")
+            body[6] = _pdf_show(f"Keywords: test, document, page{page_num}, {keywords}")
+            body[12] = _pdf_show(f"Page {page_num} specific information:")
+            body[13] = _pdf_show(f"- Section: {chr(64 + page_num)}")
+            body[14] = _pdf_show(f"- Content ID: {content_id}_p{page_num}")
             
-            for line in content_lines:
-                pdf.drawString(100, y_position, line)
-                y_position -= 15
-            
-            pdf.showPage()
+            page_number_ops = _pdf_text(b"F1", 12, 100, 720, f"Page {page_num} of {num_pages}")
+            body_ops = b"BT /F1 10 Tf 15 TL 100 680 Td\n" + b"\nT* ".join(body) + b"\nET\n"
+            pdf.add_page(title_ops + page_number_ops + body_ops)
         
-        pdf.save()
+        pdf.output()
         buffer.seek(0)
         return buffer
     
-    def ensure_container_exists(self, container_name: str):
+    async def ensure_container_exists(self, container_name: str):
         """Create container if it doesn't exist"""
+        if container_name in BlobTestDataUploader._verified_containers:
+            return
         try:
             container_client = self.blob_service_client.get_container_client(container_name)
-            if not container_client.exists():
-                container_client.create_container()
-                print(f"✓ Created container: {container_name}")
+            if not await container_client.exists():
+                await container_client.create_container()
+                logger.info("✓ Created container: %s", container_name)
             else:
-                print(f"✓ Container already exists: {container_name}")
+                logger.info("✓ Container already exists: %s", container_name)
+            BlobTestDataUploader._verified_containers.add(container_name)
         except Exception as e:
-            print(f"✗ Error with container {container_name}: {str(e)}")
+            logger.error("✗ Error with container %s: %s", container_name, e)
             raise
     
-    def upload_pdf_to_blob(self, container_name: str, blob_name: str, pdf_buffer: BytesIO):
-        """Upload PDF to blob storage"""
+    async def upload_pdf_to_blob(self, container_client: ContainerClient, blob_name: str, pdf_buffer: IO[bytes]):
+        """Upload PDF to blob storage through the state's shared container client
+        
+        The upload is skipped when the blob already holds a PDF with the same MD5.
+        """
         try:
-            blob_client = self.blob_service_client.get_blob_client(
-                container=container_name, 
-                blob=blob_name
-            )
+            md5 = hashlib.md5()
+            for chunk in iter(functools.partial(pdf_buffer.read, 64 * 1024), b""):
+                md5.update(chunk)
+            content_md5 = md5.digest()
+            length = pdf_buffer.tell()
+            pdf_buffer.seek(0)
+            
+            # Generated PDFs are deterministic, so an unchanged document's blob
+            # can be recognized from its stored hash with one HEAD request
+            try:
+                props = await container_client.get_blob_client(blob_name).get_blob_properties()
+                stored_md5 = props.content_settings.content_md5
+                if stored_md5 is not None and bytes(stored_md5) == content_md5:
+                    logger.info("  = Unchanged, skipped: %s", blob_name)
+                    return True
+            except ResourceNotFoundError:
+                pass
             
             # Set metadata including page number info
             metadata = {
-                "content_type": "application/pdf",
                 "uploaded_by": "test_script"
             }
             
-            blob_client.upload_blob(
-                pdf_buffer, 
+            await container_client.upload_blob(
+                name=blob_name,
+                data=pdf_buffer,
+                length=length,
                 overwrite=True,
-                metadata=metadata
+                metadata=metadata,
+                content_settings=ContentSettings(content_type="application/pdf", content_md5=content_md5),
+                blob_type="BlockBlob",
+                max_concurrency=8
             )
-            print(f"  ✓ Uploaded: {blob_name}")
+            logger.info("  ✓ Uploaded: %s", blob_name)
             return True
+        except ResourceNotFoundError as e:
+            # The container was deleted since it was checked; check it again next time
+            BlobTestDataUploader._verified_containers.discard(container_client.container_name)
+            logger.error("  ✗ Failed to upload %s: %s", blob_name, e)
+            return False
         except Exception as e:
-            print(f"  ✗ Failed to upload {blob_name}: {str(e)}")
+            logger.error("  ✗ Failed to upload %s: %s", blob_name, e)
             return False
     
-    def create_test_pdfs_for_state(self, state_name: str, container_name: str, num_docs: int = 3):
+    async def create_test_pdfs_for_state(self, state_name: str, container_name: str, num_docs: int = 3):
         """Create and upload test PDFs for a specific state"""
-        print(f"\n{'='*60}")
-        print(f"Creating test PDFs for {state_name}")
-        print(f"Container: {container_name}")
-        print(f"{'='*60}")
+        logger.info("\n%s\nCreating test PDFs for %s\nContainer: %s\n%s",
+                    _STATE_RULE, state_name, container_name, _STATE_RULE)
         
         # Ensure container exists
-        self.ensure_container_exists(container_name)
+        await self.ensure_container_exists(container_name)
+        container_client = self.blob_service_client.get_container_client(container_name)
         
-        # Create and upload multiple test documents
-        for doc_num in range(1, num_docs + 1):
-            # Create PDF with 3-5 pages
-            num_pages = 3 + (doc_num % 3)
-            title = f"{state_name} Document {doc_num}"
-            content_prefix = f"{state_name} Regulation"
-            
-            print(f"\nCreating: {title} ({num_pages} pages)")
-            pdf_buffer = self.create_dummy_pdf(title, num_pages, content_prefix)
-            
-            # Upload to blob
-            blob_name = f"{state_name.lower()}_doc_{doc_num}.pdf"
-            self.upload_pdf_to_blob(container_name, blob_name, pdf_buffer)
+        # Documents are generated in a worker thread and queued while earlier
+        # ones upload; None tells an upload worker there is nothing left
+        pdf_queue: asyncio.Queue = asyncio.Queue(maxsize=_PDF_QUEUE_SIZE)
+        num_workers = max(1, min(num_docs, _UPLOAD_WORKERS))
+        
+        async def produce():
+            try:
+                for doc_num in range(1, num_docs + 1):
+                    # Create PDF with 3-5 pages
+                    num_pages = 3 + (doc_num % 3)
+                    title = f"{state_name} Document {doc_num}"
+                    content_prefix = f"{state_name} Regulation"
+                    
+                    logger.info("\nCreating: %s (%d pages)", title, num_pages)
+                    pdf_buffer = await asyncio.to_thread(self.create_dummy_pdf, title, num_pages, content_prefix)
+                    blob_name = f"{state_name.lower()}_doc_{doc_num}.pdf"
+                    await pdf_queue.put((blob_name, pdf_buffer))
+            finally:
+                for _ in range(num_workers):
+                    await pdf_queue.put(None)
+        
+        async def consume():
+            while True:
+                item = await pdf_queue.get()
+                if item is None:
+                    return
+                blob_name, pdf_buffer = item
+                try:
+                    await self.upload_pdf_to_blob(container_client, blob_name, pdf_buffer)
+                finally:
+                    pdf_buffer.close()
+        
+        await asyncio.gather(produce(), *[consume() for _ in range(num_workers)])
     
-    def create_test_pdfs_for_all_states(self, num_docs_per_state: int = 3):
+    async def create_test_pdfs_for_all_states(self, num_docs_per_state: int = 3):
         """Create and upload test PDFs for all states"""
-        print(f"\n{'='*70}")
-        print(f"STARTING TEST DATA UPLOAD")
-        print(f"Creating {num_docs_per_state} documents per state")
-        print(f"{'='*70}")
+        logger.info("\n%s\nSTARTING TEST DATA UPLOAD\nCreating %d documents per state\n%s",
+                    _RULE, num_docs_per_state, _RULE)
+        
+        await self.prime_token()
         
-        for state_name, container_name in zip(self.state_names, self.containers):
+        async def create_for_state(state_name, container_name):
             try:
-                self.create_test_pdfs_for_state(state_name, container_name, num_docs_per_state)
+                await self.create_test_pdfs_for_state(state_name, container_name, num_docs_per_state)
             except Exception as e:
-                print(f"\n✗ Error processing {state_name}: {str(e)}")
-                continue
+                logger.error("\n✗ Error processing %s: %s", state_name, e)
+        
+        # Uploads are network-bound, so all states run at once over the shared client
+        await asyncio.gather(*[
+            create_for_state(state_name, container_name)
+            for state_name, container_name in self.state_container_pairs
+        ])
         
-        print(f"\n{'='*70}")
-        print("TEST DATA UPLOAD COMPLETED")
-        print(f"{'='*70}\n")
+        logger.info("\n%s\nTEST DATA UPLOAD COMPLETED\n%s\n", _RULE, _RULE)
     
-    def list_blobs_in_container(self, container_name: str):
+    async def list_blobs_in_container(self, container_name: str):
         """List all blobs in a container"""
         try:
             container_client = self.blob_service_client.get_container_client(container_name)
-            blob_list = container_client.list_blobs()
+            # Each response carries as many blobs as the service allows
+            blob_list = container_client.list_blobs(results_per_page=_LIST_PAGE_SIZE)
             
-            print(f"\nBlobs in {container_name}:")
+            logger.info("\nBlobs in %s:", container_name)
             count = 0
-            for blob in blob_list:
-                print(f"  - {blob.name} ({blob.size} bytes)")
-                count += 1
+            async for page in blob_list.by_page():
+                async for blob in page:
+                    logger.info("  - %s (%d bytes)", blob.name, blob.size)
+                    count += 1
             
             if count == 0:
-                print(f"  (No blobs found)")
+                logger.info("  (No blobs found)")
             else:
-                print(f"  Total: {count} blobs")
+                logger.info("  Total: %d blobs", count)
             
             return count
         except Exception as e:
-            print(f"Error listing blobs in {container_name}: {str(e)}")
+            logger.error("Error listing blobs in %s: %s", container_name, e)
             return 0
     
-    def list_all_blobs(self):
+    async def list_all_blobs(self):
         """List blobs in all containers"""
-        print(f"\n{'='*70}")
-        print("LISTING ALL BLOBS")
-        print(f"{'='*70}")
+        logger.info("\n%s\nLISTING ALL BLOBS\n%s", _RULE, _RULE)
         
         total_blobs = 0
-        for state_name, container_name in zip(self.state_names, self.containers):
+        for state_name, container_name in self.state_container_pairs:
             try:
-                count = self.list_blobs_in_container(container_name)
+                count = await self.list_blobs_in_container(container_name)
                 total_blobs += count
             except Exception as e:
-                print(f"Error with {state_name}: {str(e)}")
+                logger.error("Error with %s: %s", state_name, e)
                 continue
         
-        print(f"\n{'='*70}")
-        print(f"TOTAL BLOBS ACROSS ALL CONTAINERS: {total_blobs}")
-        print(f"{'='*70}\n")
+        logger.info("\n%s\nTOTAL BLOBS ACROSS ALL CONTAINERS: %d\n%s\n", _RULE, total_blobs, _RULE)
     
-    def clean_container(self, container_name: str):
+    async def clean_container(self, container_name: str):
         """Delete all blobs in a container"""
         try:
             container_client = self.blob_service_client.get_container_client(container_name)
-            blob_list = container_client.list_blobs()
             
+            # Delete through the batch endpoint, up to 256 blobs per request
             count = 0
-            for blob in blob_list:
-                blob_client = container_client.get_blob_client(blob.name)
-                blob_client.delete_blob()
-                count += 1
+            batch = []
+            async for blob_name in container_client.list_blob_names():
+                batch.append(blob_name)
+                if len(batch) == _DELETE_BATCH_SIZE:
+                    await container_client.delete_blobs(*batch)
+                    count += len(batch)
+                    batch = []
+            if batch:
+                await container_client.delete_blobs(*batch)
+                count += len(batch)
             
-            print(f"✓ Deleted {count} blobs from {container_name}")
+            logger.info("✓ Deleted %d blobs from %s", count, container_name)
             return count
         except Exception as e:
-            print(f"✗ Error cleaning {container_name}: {str(e)}")
+            logger.error("✗ Error cleaning %s: %s", container_name, e)
             return 0
     
-    def clean_all_containers(self):
+    async def clean_all_containers(self):
         """Delete all test blobs from all containers"""
-        print(f"\n{'='*70}")
-        print("CLEANING ALL CONTAINERS")
-        print(f"{'='*70}")
+        logger.info("\n%s\nCLEANING ALL CONTAINERS\n%s", _RULE, _RULE)
         
-        confirm = input("\n⚠️  This will delete ALL blobs. Continue? (yes/no): ")
+        confirm = await asyncio.to_thread(input, "\n⚠️  This will delete ALL blobs. Continue? (yes/no): ")
         if confirm.lower() != 'yes':
-            print("Cancelled.")
+            logger.info("Cancelled.")
             return
         
         total_deleted = 0
-        for state_name, container_name in zip(self.state_names, self.containers):
+        for state_name, container_name in self.state_container_pairs:
             try:
-                count = self.clean_container(container_name)
+                count = await self.clean_container(container_name)
                 total_deleted += count
             except Exception as e:
-                print(f"Error with {state_name}: {str(e)}")
+                logger.error("Error with %s: %s", state_name, e)
                 continue
         
-        print(f"\n{'='*70}")
-        print(f"TOTAL BLOBS DELETED: {total_deleted}")
-        print(f"{'='*70}\n")
+        logger.info("\n%s\nTOTAL BLOBS DELETED: %d\n%s\n", _RULE, total_deleted, _RULE)
 
 
 # Example usage
-if __name__ == "__main__":
+async def main():
     uploader = BlobTestDataUploader()
-    
-    # Create test PDFs for all states (3 documents per state, each with 3-5 pages)
-    uploader.create_test_pdfs_for_all_states(num_docs_per_state=3)
-    
-    # List all uploaded blobs
-    uploader.list_all_blobs()
-    
-    # If you want to create test data for a single state:
-    # uploader.create_test_pdfs_for_state("State1", "state1-container", num_docs=5)
-    
-    # To clean up test data (use with caution!):
-    # uploader.clean_all_containers()
\ No newline at end of file
+    try:
+        # Create test PDFs for all states (3 documents per state, each with 3-5 pages)
+        await uploader.create_test_pdfs_for_all_states(num_docs_per_state=3)
+        
+        # List all uploaded blobs
+        await uploader.list_all_blobs()
+        
+        # If you want to create test data for a single state:
+        # await uploader.create_test_pdfs_for_state("State1", "state1-container", num_docs=5)
+        
+        # To clean up test data (use with caution!):
+        # await uploader.clean_all_containers()
+    finally:
+        await uploader.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
\ No newline at end of file